@@ -2,7 +2,7 @@
 
 import os
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .judge_result import JudgeEvaluation, JudgeComparison
@@ -351,7 +351,7 @@ class JudgeManager:
         test_name: str,
         dimension: str,
         sub_dimension: str,
-        quality_criteria: Dict[str, float]
+        quality_criteria: Mapping[str, float]
     ) -> Dict[str, Any]:
         """
         使用 MiniMax 标准进行评估（0-10 分制）
@@ -460,7 +460,7 @@ class JudgeManager:
         prompt: str,
         dimension: str,
         sub_dimension: str,
-        quality_criteria: Dict[str, float]
+        quality_criteria: Mapping[str, float]
     ) -> str:
         """构建MiniMax标准评估提示词（使用 PromptBuilder）"""
         return PromptBuilder.build_minimax_evaluation(
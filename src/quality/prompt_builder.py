@@ -17,7 +17,7 @@
 """
 
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping
 
 
 class PromptBuilder:
@@ -97,7 +97,7 @@ class PromptBuilder:
         prompt: str,
         dimension: str,
         sub_dimension: str,
-        quality_criteria: Dict[str, float]
+        quality_criteria: Mapping[str, float]
     ) -> str:
         """
         构建 MiniMax 标准评估提示词（0-10分制）
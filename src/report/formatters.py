@@ -299,7 +299,7 @@ class TableFormatter:
             >>> TableFormatter.create_table_header(["模型", "分数", "等级"])
             '| 模型 | 分数 | 等级 |\\n|---------|---------|------|\\n'
         """
-        separator = "|" + "|".join(["---------"] * len(headers)) + "|"
+        separator = "|" + "---------|" * len(headers)
         header = "| " + " | ".join(headers) + " |\n"
         header += separator + "\n"
         return header
@@ -1,7 +1,9 @@
 """Markdown 报告生成器"""
 
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Any
+from itertools import islice
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 import numpy as np
 
@@ -15,6 +17,21 @@ from .formatters import (
 )
 
 
+# 表格行模板与分数格式化（模块级预绑定，避免热循环中重复构造格式串）
+_ROW_TPL = "| {label} | {cells} |\n"
+_SCORE_FMT = "{:.2f}".format
+
+
+def _format_score_cells(scores: List[Optional[float]]) -> str:
+    """将分数列表格式化为表格单元格，缺失值显示为 N/A"""
+    return " | ".join(_SCORE_FMT(x) if x is not None else "N/A" for x in scores)
+
+
+def _ellipsis(text: str, limit: int = 200) -> str:
+    """截断超长文本，超出部分以 "..." 结尾"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 class ReportGenerator:
     """Markdown 报告生成器"""
 
@@ -28,6 +45,12 @@ class ReportGenerator:
         self.config = config
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+        # 报告尾部缓存 (timestamp, content)，仅依赖时间戳
+        self._footer_cache = None
+
+        # 表格分隔行缓存 {模型列表: 分隔行}，同一报告的多张表共用
+        self._table_sep_cache: Dict[tuple, str] = {}
+
         # 确保输出目录存在
         self.output_dir = Path("results/reports")
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -58,6 +81,30 @@ class ReportGenerator:
         is_10_scale = score > 5.0
         return GradeFormatter.format_grade_with_emoji(score, is_10_scale)
 
+    def _get_model_separator(self, model_names: List[str]) -> str:
+        """
+        获取模型列的表格分隔行（不含首列）
+
+        按模型列表缓存，同一报告内的多张表共用
+
+        Args:
+            model_names: 模型名称列表
+
+        Returns:
+            分隔行字符串（含换行）
+        """
+        key = tuple(model_names)
+        sep_row = self._table_sep_cache.get(key)
+        if sep_row is None:
+            sep_row = "---------|" * len(model_names) + "\n"
+            self._table_sep_cache[key] = sep_row
+        return sep_row
+
+    def _get_model_table_header(self, first_column: str, model_names: List[str]) -> str:
+        """获取 "首列 × 模型" 表格的表头和分隔行"""
+        return (f"| {first_column} | " + " | ".join(model_names) + " |\n"
+                "|---------|" + self._get_model_separator(model_names))
+
     def generate_report(
         self,
         statistics: Dict[str, Any],
@@ -144,6 +191,8 @@ class ReportGenerator:
         minimax_stats: Dict[str, Any] = None
     ) -> str:
         """构建完整的 Markdown 报告"""
+        # 只保留有测试数据的汇总，下游各章节无需再逐项判断 test_count
+        summaries = [s for s in summaries if s['test_count'] > 0]
 
         md = ""
 
@@ -218,7 +267,7 @@ class ReportGenerator:
         # 计算总体性能统计
         overall_data = {}
         for model in model_names:
-            model_summaries = [s for s in summaries if s['model_name'] == model and s['test_count'] > 0]
+            model_summaries = [s for s in summaries if s['model_name'] == model]
             if model_summaries:
                 overall_data[model] = {
                     'ttft': sum(s['ttft_mean'] for s in model_summaries) / len(model_summaries),
@@ -248,7 +297,7 @@ class ReportGenerator:
 
         # 构建关键指标表
         md += "| 指标类别 | " + " | ".join(model_names) + " |\n"
-        md += "|----------|" + "|".join(["----------"] * len(model_names)) + "|\n"
+        md += "|----------|" + "----------|" * len(model_names) + "\n"
 
         # TTFT 行
         if overall_data:
@@ -355,7 +404,7 @@ class ReportGenerator:
         for category in test_categories:
             for model in model_names:
                 model_data = [s for s in summaries if s['category'] == category and s['model_name'] == model]
-                if model_data and model_data[0]['test_count'] > 0:
+                if model_data:
                     if category not in category_data:
                         category_data[category] = {}
                     category_data[category][model] = model_data[0]
@@ -553,7 +602,7 @@ class ReportGenerator:
         ]
 
         md += "| 能力维度 | " + " | ".join(models) + " |\n"
-        md += "|----------|" + "|".join(["---------"] * len(models)) + "|\n"
+        md += "|----------|" + self._get_model_separator(models)
 
         for dim_name, _ in sub_dimensions:
             row = [dim_name]
@@ -730,7 +779,7 @@ class ReportGenerator:
         # 计算总体平均值
         overall_data = {}
         for model in model_names:
-            model_summaries = [s for s in summaries if s['model_name'] == model and s['test_count'] > 0]
+            model_summaries = [s for s in summaries if s['model_name'] == model]
             if model_summaries:
                 avg_ttft = sum(s['ttft_mean'] for s in model_summaries) / len(model_summaries)
                 avg_speed = sum(s['speed_mean'] for s in model_summaries) / len(model_summaries)
@@ -771,8 +820,7 @@ class ReportGenerator:
         test_categories: List[str]
     ) -> str:
         """生成 TTFT 对比表（使用 Markdown 粗体突出优势值）"""
-        md = "| 测试类别 | " + " | ".join(model_names) + " |\n"
-        md += "|---------|" + "|".join(["---------"] * len(model_names)) + "|\n"
+        md = self._get_model_table_header("测试类别", model_names)
 
         for category in test_categories:
             row = [category]
@@ -781,7 +829,7 @@ class ReportGenerator:
             model_ttfts = {}
             for model in model_names:
                 model_data = [s for s in summaries if s['category'] == category and s['model_name'] == model]
-                if model_data and model_data[0]['test_count'] > 0:
+                if model_data:
                     ttft = model_data[0]['ttft_mean']
                     model_ttfts[model] = ttft
 
@@ -807,8 +855,7 @@ class ReportGenerator:
         test_categories: List[str]
     ) -> str:
         """生成生成速度对比表（使用 Markdown 粗体突出优势值）"""
-        md = "| 测试类别 | " + " | ".join(model_names) + " |\n"
-        md += "|---------|" + "|".join(["---------"] * len(model_names)) + "|\n"
+        md = self._get_model_table_header("测试类别", model_names)
 
         for category in test_categories:
             row = [category]
@@ -817,7 +864,7 @@ class ReportGenerator:
             model_speeds = {}
             for model in model_names:
                 model_data = [s for s in summaries if s['category'] == category and s['model_name'] == model]
-                if model_data and model_data[0]['test_count'] > 0:
+                if model_data:
                     speed = model_data[0]['speed_mean']
                     model_speeds[model] = speed
 
@@ -843,8 +890,7 @@ class ReportGenerator:
         test_categories: List[str]
     ) -> str:
         """生成总响应时间对比表"""
-        md = "| 测试类别 | " + " | ".join(model_names) + " |\n"
-        md += "|---------|" + "|".join(["---------"] * len(model_names)) + "|\n"
+        md = self._get_model_table_header("测试类别", model_names)
 
         for category in test_categories:
             row = [category]
@@ -853,7 +899,7 @@ class ReportGenerator:
             model_times = {}
             for model in model_names:
                 model_data = [s for s in summaries if s['category'] == category and s['model_name'] == model]
-                if model_data and model_data[0]['test_count'] > 0:
+                if model_data:
                     total_time = model_data[0]['total_time_mean']
                     model_times[model] = total_time
                 else:
@@ -889,7 +935,7 @@ class ReportGenerator:
             category_data = {}
             for model in model_names:
                 model_summaries = [s for s in summaries if s['category'] == category and s['model_name'] == model]
-                if model_summaries and model_summaries[0]['test_count'] > 0:
+                if model_summaries:
                     category_data[model] = model_summaries[0]
 
             if len(category_data) < 2:
@@ -908,24 +954,21 @@ class ReportGenerator:
                 ttft_better = model1 if ttft_diff > 0 else model2
                 ttft_pct = abs(ttft_diff) / data2['ttft_mean'] * 100 if data2['ttft_mean'] > 0 else 0
 
-                md += f"- **TTFT**: {ttft_better} 领先 {ttft_pct:.1f}% "
-                md += f"({data1['ttft_mean']:.2f}ms vs {data2['ttft_mean']:.2f}ms)\n"
-
                 # 生成速度对比
                 speed_diff = data1['speed_mean'] - data2['speed_mean']
                 speed_better = model1 if speed_diff > 0 else model2
                 speed_pct = abs(speed_diff) / data2['speed_mean'] * 100 if data2['speed_mean'] > 0 else 0
 
-                md += f"- **生成速度**: {speed_better} 领先 {speed_pct:.1f}% "
-                md += f"({data1['speed_mean']:.2f} vs {data2['speed_mean']:.2f} tokens/s)\n"
-
                 # 总时间对比
                 time_diff = data2['total_time_mean'] - data1['total_time_mean']
                 time_better = model1 if time_diff > 0 else model2
                 time_pct = abs(time_diff) / data2['total_time_mean'] * 100 if data2['total_time_mean'] > 0 else 0
 
-                md += f"- **总响应时间**: {time_better} 领先 {time_pct:.1f}% "
-                md += f"({data1['total_time_mean']:.2f}ms vs {data2['total_time_mean']:.2f}ms)\n\n"
+                md += f"""- **TTFT**: {ttft_better} 领先 {ttft_pct:.1f}% ({data1['ttft_mean']:.2f}ms vs {data2['ttft_mean']:.2f}ms)
+- **生成速度**: {speed_better} 领先 {speed_pct:.1f}% ({data1['speed_mean']:.2f} vs {data2['speed_mean']:.2f} tokens/s)
+- **总响应时间**: {time_better} 领先 {time_pct:.1f}% ({data1['total_time_mean']:.2f}ms vs {data2['total_time_mean']:.2f}ms)
+
+"""
 
         return md
 
@@ -939,13 +982,14 @@ class ReportGenerator:
         md = ""
 
         # 统计各模型在各类别的优势次数
-        advantages = {model: {'ttft': 0, 'speed': 0, 'time': 0} for model in model_names}
+        # 以 (模型, 指标) 为键的扁平计数器，每次递增只需一次哈希查找
+        advantages = Counter()
 
         for category in test_categories:
             category_data = {}
             for model in model_names:
                 model_summaries = [s for s in summaries if s['category'] == category and s['model_name'] == model]
-                if model_summaries and model_summaries[0]['test_count'] > 0:
+                if model_summaries:
                     category_data[model] = model_summaries[0]
 
             if len(category_data) == 2:
@@ -953,22 +997,13 @@ class ReportGenerator:
                 data1, data2 = category_data[model1], category_data[model2]
 
                 # TTFT 优势
-                if data1['ttft_mean'] < data2['ttft_mean']:
-                    advantages[model1]['ttft'] += 1
-                else:
-                    advantages[model2]['ttft'] += 1
+                advantages[(model1 if data1['ttft_mean'] < data2['ttft_mean'] else model2, 'ttft')] += 1
 
                 # 生成速度优势
-                if data1['speed_mean'] > data2['speed_mean']:
-                    advantages[model1]['speed'] += 1
-                else:
-                    advantages[model2]['speed'] += 1
+                advantages[(model1 if data1['speed_mean'] > data2['speed_mean'] else model2, 'speed')] += 1
 
                 # 总时间优势
-                if data1['total_time_mean'] < data2['total_time_mean']:
-                    advantages[model1]['time'] += 1
-                else:
-                    advantages[model2]['time'] += 1
+                advantages[(model1 if data1['total_time_mean'] < data2['total_time_mean'] else model2, 'time')] += 1
 
         # 生成总结
         md += "**各模型优势场景统计**：\n\n"
@@ -976,25 +1011,28 @@ class ReportGenerator:
         md += "|------|----------|-------------|----------|------|\n"
 
         # 找出总体优胜者用于格式化
-        model_totals = {model: advantages[model]['ttft'] + advantages[model]['speed'] + advantages[model]['time'] for model in model_names}
+        model_totals = {
+            model: advantages[(model, 'ttft')] + advantages[(model, 'speed')] + advantages[(model, 'time')]
+            for model in model_names
+        }
         max_total = max(model_totals.values()) if model_totals else 0
         all_totals = list(model_totals.values())
 
         for model in model_names:
-            adv = advantages[model]
             total = model_totals[model]
             # 突出获胜模型的名称和总分数（🏆 在较高的总分旁边）
             model_formatted = self._format_winning_model(model, total == max_total)
             total_formatted = self._format_winning_score(total, all_totals, is_lower_better=False)
-            md += f"| {model_formatted} | {adv['ttft']} | {adv['speed']} | {adv['time']} | {total_formatted} |\n"
+            md += (f"| {model_formatted} | {advantages[(model, 'ttft')]} | {advantages[(model, 'speed')]} "
+                   f"| {advantages[(model, 'time')]} | {total_formatted} |\n")
 
         md += "\n"
 
         # 综合分析
         md += "**综合分析**：\n\n"
 
-        model1_adv = advantages[model_names[0]]['ttft'] + advantages[model_names[0]]['speed'] + advantages[model_names[0]]['time']
-        model2_adv = advantages[model_names[1]]['ttft'] + advantages[model_names[1]]['speed'] + advantages[model_names[1]]['time']
+        model1_adv = model_totals[model_names[0]]
+        model2_adv = model_totals[model_names[1]]
 
         if model1_adv > model2_adv:
             md += f"- **{model_names[0]}** 在 {model1_adv} 个场景中表现更好\n"
@@ -1026,7 +1064,7 @@ class ReportGenerator:
         # 计算总体统计
         overall_stats = {}
         for model in model_names:
-            model_summaries = [s for s in summaries if s['model_name'] == model and s['test_count'] > 0]
+            model_summaries = [s for s in summaries if s['model_name'] == model]
             if model_summaries:
                 overall_stats[model] = {
                     'avg_ttft': sum(s['ttft_mean'] for s in model_summaries) / len(model_summaries),
@@ -1039,23 +1077,27 @@ class ReportGenerator:
             stats1 = overall_stats[model1]
             stats2 = overall_stats[model2]
 
-            # TTFT 对比
-            if stats1['avg_ttft'] < stats2['avg_ttft']:
-                md += f"- **首次响应速度**: {model1} 更快，平均快 {((stats2['avg_ttft'] - stats1['avg_ttft']) / stats2['avg_ttft'] * 100):.1f}%\n"
+            # TTFT 对比（越小越好，以较慢一方为基准；基准非正时改为输出绝对值）
+            ttft_winner, fast_ttft, slow_ttft = (
+                (model1, stats1['avg_ttft'], stats2['avg_ttft']) if stats1['avg_ttft'] < stats2['avg_ttft']
+                else (model2, stats2['avg_ttft'], stats1['avg_ttft'])
+            )
+            if slow_ttft > 0:
+                ttft_pct = (slow_ttft - fast_ttft) / slow_ttft * 100
+                md += f"- **首次响应速度**: {ttft_winner} 更快，平均快 {ttft_pct:.1f}%\n"
             else:
-                md += f"- **首次响应速度**: {model2} 更快，平均快 {((stats1['avg_ttft'] - stats2['avg_ttft']) / stats1['avg_ttft'] * 100):.1f}%\n"
+                md += f"- **首次响应速度**: {ttft_winner} 更快 ({fast_ttft:.2f} vs {slow_ttft:.2f} ms)\n"
 
-            # 生成速度对比
-            if stats1['avg_speed'] > stats2['avg_speed']:
-                if stats2['avg_speed'] > 0:
-                    md += f"- **生成速度**: {model1} 更快，平均快 {((stats1['avg_speed'] - stats2['avg_speed']) / stats2['avg_speed'] * 100):.1f}%\n"
-                else:
-                    md += f"- **生成速度**: {model1} 更快 ({stats1['avg_speed']:.2f} vs {stats2['avg_speed']:.2f} tokens/s)\n"
+            # 生成速度对比（越大越好，以较慢一方为基准；基准非正时改为输出绝对值）
+            speed_winner, fast_speed, slow_speed = (
+                (model1, stats1['avg_speed'], stats2['avg_speed']) if stats1['avg_speed'] > stats2['avg_speed']
+                else (model2, stats2['avg_speed'], stats1['avg_speed'])
+            )
+            if slow_speed > 0:
+                speed_pct = (fast_speed - slow_speed) / slow_speed * 100
+                md += f"- **生成速度**: {speed_winner} 更快，平均快 {speed_pct:.1f}%\n"
             else:
-                if stats1['avg_speed'] > 0:
-                    md += f"- **生成速度**: {model2} 更快，平均快 {((stats2['avg_speed'] - stats1['avg_speed']) / stats1['avg_speed'] * 100):.1f}%\n"
-                else:
-                    md += f"- **生成速度**: {model2} 更快 ({stats2['avg_speed']:.2f} vs {stats1['avg_speed']:.2f} tokens/s)\n"
+                md += f"- **生成速度**: {speed_winner} 更快 ({fast_speed:.2f} vs {slow_speed:.2f} tokens/s)\n"
 
             md += "\n"
 
@@ -1170,21 +1212,17 @@ class ReportGenerator:
         # 按类别统计
         md += "**按类别统计**：\n\n"
         md += "| 类别 | " + " | ".join(model_names) + " |\n"
-        md += "|------|" + "|".join(["---------"] * len(model_names)) + "|\n"
+        md += "|------|" + self._get_model_separator(model_names)
 
         for category in test_categories:
             if category in quality_stats.get("by_category", {}):
-                row = [category]
-                for model_name in model_names:
-                    if model_name in quality_stats["by_category"][category]:
-                        model_stats = quality_stats["by_category"][category][model_name]
-                        if judge_name in model_stats:
-                            row.append(f"{model_stats[judge_name]['avg_score']:.2f}")
-                        else:
-                            row.append("N/A")
-                    else:
-                        row.append("N/A")
-                md += "| " + " | ".join(row) + " |\n"
+                category_stats = quality_stats["by_category"][category]
+                row_scores = [
+                    category_stats[model_name][judge_name]['avg_score']
+                    if judge_name in category_stats.get(model_name, {}) else None
+                    for model_name in model_names
+                ]
+                md += _ROW_TPL.format(label=category, cells=_format_score_cells(row_scores))
 
         md += "\n"
         return md
@@ -1205,24 +1243,20 @@ class ReportGenerator:
 
         # 按类别对比
         md += "| 测试类别 | " + " | ".join([f"{j} 评估 {m}" for j in judges for m in model_names]) + " |\n"
-        md += "|---------|" + "|".join(["------------------"] * (len(judges) * len(model_names))) + "|\n"
+        md += "|---------|" + "------------------|" * (len(judges) * len(model_names)) + "\n"
 
         for category in test_categories:
             if category not in quality_stats.get("by_category", {}):
                 continue
 
-            row = [category]
             category_stats = quality_stats["by_category"][category]
-
-            for judge_name in judges:
-                for model_name in model_names:
-                    if model_name in category_stats and judge_name in category_stats[model_name]:
-                        score = category_stats[model_name][judge_name]['avg_score']
-                        row.append(f"{score:.2f}")
-                    else:
-                        row.append("N/A")
-
-            md += "| " + " | ".join(row) + " |\n"
+            row_scores = [
+                category_stats[model_name][judge_name]['avg_score']
+                if judge_name in category_stats.get(model_name, {}) else None
+                for judge_name in judges
+                for model_name in model_names
+            ]
+            md += _ROW_TPL.format(label=category, cells=_format_score_cells(row_scores))
 
         md += "\n"
 
@@ -1248,17 +1282,17 @@ class ReportGenerator:
         model_names: List[str]
     ) -> str:
         """生成质量评估示例"""
-        md = "**典型评估案例**：\n\n"
-
-        # 找出有质量评估的结果
-        quality_results = [r for r in raw_results if r.get("quality_evaluations")]
+        # 找出前 3 个有质量评估的结果（惰性过滤，找够即停止扫描）
+        quality_results = list(islice(
+            (r for r in raw_results if r.get("quality_evaluations")), 3
+        ))
 
         if not quality_results:
-            md += "*暂无详细评估案例*\n\n"
-            return md
+            return "**典型评估案例**：\n\n*暂无详细评估案例*\n\n"
+
+        md = "**典型评估案例**：\n\n"
 
-        # 展示前 3 个案例
-        for i, result in enumerate(quality_results[:3], 1):
+        for i, result in enumerate(quality_results, 1):
             md += f"#### 案例 {i}: {result.get('test_name', 'Unknown')}\n\n"
             md += f"- **测试类别**: {result.get('test_category', 'N/A')}\n"
             md += f"- **被评估模型**: {result.get('model_name', 'N/A')}\n\n"
@@ -1274,9 +1308,8 @@ class ReportGenerator:
                 # 展示各标准分数
                 scores = evaluation.get('scores', {})
                 if scores:
-                    md += "- 各项分数:\n"
-                    for criterion, score in scores.items():
-                        md += f"  - {criterion}: {score:.1f}\n"
+                    score_lines = [f"  - {criterion}: {score:.1f}" for criterion, score in scores.items()]
+                    md += "- 各项分数:\n" + "\n".join(score_lines) + "\n"
 
                 # 展示优缺点
                 if evaluation.get('strengths'):
@@ -1288,8 +1321,7 @@ class ReportGenerator:
                 # 展示评估理由（截断）
                 reasoning = evaluation.get('reasoning', '')
                 if reasoning:
-                    reasoning_short = reasoning[:200] + "..." if len(reasoning) > 200 else reasoning
-                    md += f"- 评估理由: {reasoning_short}\n"
+                    md += f"- 评估理由: {_ellipsis(reasoning)}\n"
 
                 md += "\n"
 
@@ -1298,7 +1330,13 @@ class ReportGenerator:
         return md
 
     def _generate_footer(self) -> str:
-        """生成报告尾部"""
+        """生成报告尾部（按时间戳缓存，重复生成报告时直接复用）"""
+        if self._footer_cache is None or self._footer_cache[0] != self.timestamp:
+            self._footer_cache = (self.timestamp, self._build_footer())
+        return self._footer_cache[1]
+
+    def _build_footer(self) -> str:
+        """构建报告尾部内容"""
         return f"""---
 
 ## 附录
@@ -14,10 +14,24 @@
 """
 
 import json
-from datetime import datetime
-from typing import Dict, List, Any
+import os
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Any, Sequence, TextIO, Tuple
 from pathlib import Path
 
+import numpy as np
+
+# 尝试导入 orjson（C 实现，解析大体积 JSON 更快），不可用时回退到标准库 json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 # 导入共享的格式化器
 from .formatters import (
     ScoreFormatter,
@@ -28,6 +42,243 @@ from .formatters import (
 )
 
 
+# =============================================================================
+# 分档阈值表（升序阈值 + 对应标签，使用 bisect 一次查找代替 if/elif 链）
+# =============================================================================
+
+# 维度评价: <6.0 待改进, 6.0+ 合格, 7.5+ 良好, 9.0+ 优秀
+_EVAL_THRESHOLDS = (6.0, 7.5, 9.0)
+_EVAL_LABELS = ("待改进", "合格", "良好", "优秀")
+_EVAL_EMOJIS = ("🔴", "🟡", "🟢", "🟢")
+
+# 热力图单元格: <6.0, 6.0+, 7.0+, 8.0+, 9.0+
+_HEATMAP_THRESHOLDS = (6.0, 7.0, 8.0, 9.0)
+_HEATMAP_CELLS = ("··········", "░░░░░░░░░░", "▒▒▒▒▒▒▒▒▒", "▓▓▓▓▓▓▓▓▓", "██████████")
+
+# 密度字符（由低到高），柱状图按占最大值比例分档，进度条按占满分比例分档（60%/75%/90%）
+_DENSITY_CHARS = ("░", "▒", "▓", "█")
+_BAR_RATIO_THRESHOLDS = (0.4, 0.6, 0.8)
+_PROGRESS_RATIO_THRESHOLDS = (0.6, 0.75, 0.9)
+
+# 堆叠条形图按维度权重分档: <25% ▒, 25%+ ▓, 35%+ █
+_WEIGHT_THRESHOLDS = (0.25, 0.35)
+_WEIGHT_CHARS = ("▒", "▓", "█")
+
+# 时间轴按占最大时间比例分档（含上界）: ≤30% ▁, ≤60% ▂, ≤80% ▃, >80% ▄
+_TIMELINE_RATIO_THRESHOLDS = (0.3, 0.6, 0.8)
+_TIMELINE_CHARS = ("▁", "▂", "▃", "▄")
+
+
+# 预分配的字符缓冲区：图表中的条形统一从这里切片，避免每行重复构造 "char" * n
+# （各图表宽度均不超过 40 字符，缓冲区留有余量）
+_BAR_BUFFER_LEN = 128
+_BARS = {c: c * _BAR_BUFFER_LEN for c in "█▓▒░▁▂▃▄─"}
+
+
+# =============================================================================
+# 数据驱动图表规格（柱状图 / 时间轴 / 进度条 / 热力图共用一套归一化与分档逻辑）
+# =============================================================================
+
+@dataclass(frozen=True)
+class _ChartSpec:
+    """
+    图表渲染规格
+
+    Attributes:
+        thresholds: 分档阈值（相对刻度上限的比例，升序）
+        side: searchsorted 方向，"right" 表示阈值归入高档，"left" 表示阈值归入低档（含上界）
+        width: 满刻度对应的字符数（条长 = 值 / 刻度上限 * width / step）
+        step: 每个字符代表的刻度单位
+        row: 行格式化函数 (label, value, measure, length, idx) -> str，
+             其中 measure = 值 / 刻度上限 * width
+        closing: 代码块结束标记
+        legend: 图例（为空则不输出）
+    """
+    thresholds: Tuple[float, ...]
+    side: str
+    width: int
+    step: int
+    row: Callable[..., str]
+    closing: str = "```"
+    legend: str = ""
+
+
+def _bar_row(label, value, measure, length, idx) -> str:
+    return f"{'':>12} │{_BARS[_DENSITY_CHARS[idx]][:length]}│ {label}: {value:.2f}"
+
+
+def _timeline_row(label, value, measure, length, idx) -> str:
+    return f"{label:12} {_BARS[_TIMELINE_CHARS[idx]][:length]} {value:.0f}ms"
+
+
+def _progress_row(label, value, measure, length, idx) -> str:
+    bar = _BARS[_DENSITY_CHARS[idx]][:length] + _BARS["░"][length:20]
+    return f"{label:20} [{bar}] {measure:5.1f}% ({value:.2f})"
+
+
+def _heatmap_row(label, values, measures, lengths, idxs) -> str:
+    return f"{label:10}" + "".join(f"{_HEATMAP_CELLS[idx]:^10}" for idx in idxs)
+
+
+_CHART_SPECS = {
+    "bar": _ChartSpec(_BAR_RATIO_THRESHOLDS, "right", 40, 1, _bar_row),
+    "timeline": _ChartSpec(_TIMELINE_RATIO_THRESHOLDS, "left", 30, 1, _timeline_row,
+                           closing="\n```", legend="**图例**: ▁≤30% ▂≤60% ▃≤80% ▄>80%"),
+    "progress": _ChartSpec(_PROGRESS_RATIO_THRESHOLDS, "right", 100, 5, _progress_row,
+                           closing="\n```"),
+    # 热力图按绝对分值分档（刻度上限取 1.0），不绘制条长
+    "heatmap": _ChartSpec(_HEATMAP_THRESHOLDS, "right", 0, 1, _heatmap_row,
+                          legend="**密度**: █=9.0+ ▓=8.0+ ▒=7.0+ ░=6.0+ ·=<6.0"),
+}
+
+
+# =============================================================================
+# 固定章节模板（常量行合并为一个模板，每个章节只做一次 format）
+# =============================================================================
+
+_FRONT_MATTER_TMPL = """\
+# DeepSeek vs GLM - MiniMax 标准评测报告
+
+**报告生成时间**: {report_date}
+**评测模式**: {evaluation_mode} ({total_tests}个用例)
+**报告ID**: {report_id}
+
+---
+
+"""
+
+_METHODOLOGY_TMPL = """\
+## 六、评测方法论
+
+### 测试设计
+
+- **测试用例总数**: {total_tests}
+- **测试维度**: 4个
+- **成功率**: {success_rate:.1f}%
+
+### 维度权重
+
+| 维度 | 权重 | 说明 |
+|------|------|------|
+"""
+
+_RAW_DATA_TMPL = """\
+## 七、原始数据摘要
+
+### 测试执行情况
+
+| 指标 | 数值 |
+|------|------|
+| 总测试数 | {total_tests} |
+| 成功执行 | {successful_tests} |
+| 执行失败 | {failed_tests} |
+| 成功率 | {success_rate:.1f}% |
+
+### 模型配置
+
+"""
+
+_APPENDIX_TMPL = """\
+---
+
+## 附录
+
+### 附录A: 评分等级定义
+
+| 等级 | 分数范围 |
+|------|---------|
+| 🟢 优秀 | 9.0-10.0 |
+| 🟢 良好 | 7.5-8.9 |
+| 🟡 合格 | 6.0-7.4 |
+| 🔴 不合格 | 3.0-5.9 |
+| 🔴 严重缺陷 | 0-2.9 |
+
+### 附录B: 数据文件
+
+**JSON原始数据**: `{output_dir}/{report_id}.json`
+**完整配置**: `config.yaml`
+**测试用例定义**: `src/tests/cases_minimax/`
+
+---
+
+*报告生成工具: DeepSeek vs GLM MiniMax 评测系统 v2.0*
+*生成时间: {start_time}*
+"""
+
+# 方法论章节的维度名称与说明
+_DIMENSION_DESCRIPTIONS = {
+    "basic_performance": ("基础性能", "响应速度、稳定性"),
+    "core_capabilities": ("核心能力", "推理、理解、生成能力"),
+    "practical_scenarios": ("实用场景", "实际应用表现"),
+    "advanced_features": ("高级特性", "创造性、多轮对话等")
+}
+
+
+@lru_cache(maxsize=8)
+def _render_methodology(weights: Tuple[Tuple[str, float], ...],
+                        total_tests: int, success_rate: float) -> str:
+    """
+    渲染评测方法论章节（同一配置下批量生成报告时内容相同，按参数缓存）
+
+    Args:
+        weights: 维度权重 (维度, 权重) 元组，保持配置中的顺序
+        total_tests: 测试用例总数
+        success_rate: 成功率（0-1）
+
+    Returns:
+        str: 章节 Markdown 文本
+    """
+    rows = [_METHODOLOGY_TMPL.format(total_tests=total_tests, success_rate=success_rate * 100)]
+    for dim, weight in weights:
+        cn_name, desc = _DIMENSION_DESCRIPTIONS.get(dim, (dim, ""))
+        rows.append(f"| {cn_name} | {weight:.0%} | {desc} |\n")
+    rows.append("\n")
+    return "".join(rows)
+
+
+@lru_cache(maxsize=8)
+def _render_appendix(output_dir_name: str, report_id: str, start_time: str) -> str:
+    """渲染附录（按参数缓存）"""
+    return _APPENDIX_TMPL.format(
+        output_dir=output_dir_name,
+        report_id=report_id,
+        start_time=start_time
+    )
+
+
+def _score_bar(score: float) -> str:
+    """10分制得分的20字符刻度条（█ 填充，░ 补齐）"""
+    bar_len = int(score / 10 * 20)
+    return _BARS["█"][:bar_len] + _BARS["░"][bar_len:20]
+
+
+# 散点图网格单元格：网格值 -1 为空，0/1 为数据点标签（按 网格值 + 1 索引）
+_SCATTER_CELLS = (" ", "A", "B")
+
+
+def _fill_scatter_grid(perf, qual, grid_size, max_perf, max_qual):
+    """
+    将数据点映射到散点图网格
+
+    Args:
+        perf: 性能数据（float64 数组）
+        qual: 质量数据（float64 数组）
+        grid_size: 网格边长
+        max_perf: 性能最大值（> 0）
+        max_qual: 质量最大值（> 0）
+
+    Returns:
+        np.ndarray: int8 网格，-1 为空，其余为数据点标签序号
+    """
+    grid = np.full((grid_size, grid_size), -1, np.int8)
+    for i in range(min(perf.size, qual.size)):
+        x = int((perf[i] / max_perf) * (grid_size - 1))
+        y = int((qual[i] / max_qual) * (grid_size - 1))
+        if 0 <= x < grid_size and 0 <= y < grid_size:
+            grid[grid_size - 1 - y, x] = i % 2
+    return grid
+
+
 class MarkdownReportGenerator:
     """纯Markdown报告生成器"""
 
@@ -39,7 +290,15 @@ class MarkdownReportGenerator:
             output_dir: 输出目录
         """
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not self.output_dir.exists():
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_dir_str = os.fspath(self.output_dir)
+
+        # 质量得分的列式视图，由 _generate_complete_report 在每次生成时构建
+        self._models: List[str] = []
+        self._dims: List[str] = []
+        self._score_mat = np.empty((0, 0))
+        self._overall = np.empty(0)
 
     def generate_from_json(self, json_path: str) -> str:
         """
@@ -51,127 +310,143 @@ class MarkdownReportGenerator:
         Returns:
             str: Markdown报告文件路径
         """
-        # 读取JSON数据
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # 生成报告内容
-        content = self._generate_complete_report(data)
-
-        # 保存Markdown文件
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 读取JSON数据（优先使用 orjson）
+        if ORJSON_AVAILABLE:
+            with open(json_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        # 生成报告并直接流式写入Markdown文件
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = f"minimax_report_{timestamp}.md"
-        filepath = self.output_dir / filename
+        filepath = os.path.join(self._output_dir_str, filename)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # 1MB 写缓冲，各章节直接写入文件句柄，无需在内存中拼接整份报告
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            self._generate_complete_report(data, f)
 
-        return str(filepath)
+        return filepath
 
-    def _generate_complete_report(self, data: Dict) -> str:
-        """生成完整报告"""
-        sections = []
-
-        # 报告头部
-        sections.append(self._generate_front_matter(data))
-
-        # 一、评测概要
-        sections.append(self._generate_summary_section(data))
-
-        # 二、性能指标分析
-        sections.append(self._generate_performance_section(data))
-
-        # 三、质量评估分析
-        sections.append(self._generate_quality_section(data))
-
-        # 四、维度详细分析
-        sections.append(self._generate_dimension_section(data))
-
-        # 五、使用建议
-        sections.append(self._generate_recommendations_section(data))
-
-        # 六、评测方法论
-        sections.append(self._generate_methodology_section(data))
+    def _generate_complete_report(self, data: Dict, out: TextIO) -> None:
+        """
+        生成完整报告
 
-        # 七、原始数据摘要
-        sections.append(self._generate_raw_data_section(data))
+        各章节与图表直接写入输出流（文件句柄或 io.StringIO），每行以换行结尾，
+        不在内存中保留中间字符串
 
-        # 附录
-        sections.append(self._generate_appendix_section(data))
+        Args:
+            data: 评测 JSON 数据
+            out: 文本输出流
+        """
+        self._build_score_arrays(data["quality_scores"])
+
+        sections = (
+            self._generate_front_matter,                # 报告头部
+            self._generate_summary_section,             # 一、评测概要
+            self._generate_performance_section,         # 二、性能指标分析
+            self._generate_quality_section,             # 三、质量评估分析
+            self._generate_dimension_section,           # 四、维度详细分析
+            self._generate_recommendations_section,     # 五、使用建议
+            self._generate_methodology_section,         # 六、评测方法论
+            self._generate_raw_data_section,            # 七、原始数据摘要
+            self._generate_appendix_section,            # 附录
+        )
+
+        for i, generate_section in enumerate(sections):
+            if i:
+                # 章节之间空一行
+                out.write("\n")
+            generate_section(data, out)
+
+    def _build_score_arrays(self, quality_scores: Dict) -> None:
+        """
+        将按模型嵌套的质量得分转换为列式数组，供各章节共享
 
-        return "\n\n".join(sections)
+        - self._models: 模型名称列表
+        - self._dims: 维度名称列表（以第一个模型的维度顺序为准）
+        - self._score_mat: 维度得分矩阵，形状为 (模型数, 维度数)
+        - self._overall: 综合得分向量
 
-    def _generate_front_matter(self, data: Dict) -> str:
+        Args:
+            quality_scores: JSON 中的 quality_scores 字段
+        """
+        models = list(quality_scores)
+        dims = list(quality_scores[models[0]]["dimension_scores"]) if models else []
+
+        self._models = models
+        self._dims = dims
+        self._score_mat = np.array(
+            [[quality_scores[m]["dimension_scores"][d] for d in dims] for m in models],
+            dtype=np.float64
+        ).reshape(len(models), len(dims))
+        self._overall = np.array(
+            [quality_scores[m]["overall_score"] for m in models], dtype=np.float64
+        )
+
+    def _generate_front_matter(self, data: Dict, out: TextIO) -> None:
         """生成报告头部"""
         metadata = data["metadata"]
-        lines = [
-            f"# DeepSeek vs GLM - MiniMax 标准评测报告",
-            "",
-            f"**报告生成时间**: {metadata['start_time'][:10]}",
-            f"**评测模式**: {metadata.get('evaluation_mode', 'standard').title()} ({metadata['total_tests']}个用例)",
-            f"**报告ID**: {metadata['report_id']}",
-            "",
-            "---",
-            ""
-        ]
-        return "\n".join(lines)
-
-    def _generate_summary_section(self, data: Dict) -> str:
+        out.write(_FRONT_MATTER_TMPL.format(
+            report_date=metadata['start_time'][:10],
+            evaluation_mode=metadata.get('evaluation_mode', 'standard').title(),
+            total_tests=metadata['total_tests'],
+            report_id=metadata['report_id']
+        ))
+
+    def _generate_summary_section(self, data: Dict, out: TextIO) -> None:
         """生成评测概要"""
-        lines = [
-            "## 一、评测概要",
-            ""
-        ]
+        out.write("## 一、评测概要\n\n")
 
         quality_scores = data["quality_scores"]
-        models = list(quality_scores.keys())
+        models = self._models
+
+        # 按综合得分降序得到的排名，JSON 中缺少 rank 字段时使用
+        order = np.argsort(-self._overall, kind="stable")
+        computed_ranks = np.empty(len(models), dtype=np.int64)
+        computed_ranks[order] = np.arange(1, len(models) + 1)
 
         # 综合得分表格
-        lines.append("### 综合得分")
-        lines.append("")
-        lines.append("| 模型 | 综合得分 | 等级 | 排名 |")
-        lines.append("|------|---------|------|------|")
+        out.write("### 综合得分\n\n")
+        out.write("| 模型 | 综合得分 | 等级 | 排名 |\n")
+        out.write("|------|---------|------|------|\n")
 
-        for model in models:
+        for model, computed_rank in zip(models, computed_ranks.tolist()):
             model_data = quality_scores[model]
             score = model_data["overall_score"]
             grade = model_data["grade"]
-            rank = model_data["rank"]
+            rank = model_data.get("rank", computed_rank)
             emoji = self._get_grade_emoji(grade)
-            lines.append(f"| **{model.capitalize()}** | **{score:.2f}/10** | {emoji} {grade} | #{rank} |")
+            out.write(f"| **{model.capitalize()}** | **{score:.2f}/10** | {emoji} {grade} | #{rank} |\n")
 
-        lines.append("")
+        out.write("\n")
 
         # 核心发现
-        lines.append("### 核心发现")
-        lines.append("")
+        out.write("### 核心发现\n\n")
 
         # 找出最佳模型
-        best_model = max(quality_scores.items(), key=lambda x: x[1]["overall_score"])
-        best_name = best_model[0].capitalize()
-        best_score = best_model[1]["overall_score"]
+        best_idx = int(np.argmax(self._overall))
+        best_name = models[best_idx].capitalize()
+        best_score = float(self._overall[best_idx])
 
-        lines.append(f"- ✨ **最佳模型**: {best_name} ({best_score:.2f}/10)")
+        out.write(f"- ✨ **最佳模型**: {best_name} ({best_score:.2f}/10)\n")
 
         # 找出最快的模型（从performance_summaries中）
         if "performance_summaries" in data and len(data["performance_summaries"]) > 0:
             first_summary = data["performance_summaries"][0]
             if "comparison" in first_summary and "ttft_winner" in first_summary["comparison"]:
                 fastest = first_summary["comparison"]["ttft_winner"].capitalize()
-                lines.append(f"- ⚡ **最快响应**: {fastest} (首次响应)")
+                out.write(f"- ⚡ **最快响应**: {fastest} (首次响应)\n")
 
-        lines.append(f"- 📊 **测试成功率**: {data['statistics']['success_rate']*100:.1f}% "
-                     f"({data['statistics']['successful_tests']}/{data['statistics']['total_tests']})")
+        out.write(f"- 📊 **测试成功率**: {data['statistics']['success_rate']*100:.1f}% "
+                  f"({data['statistics']['successful_tests']}/{data['statistics']['total_tests']})\n")
 
-        lines.append("")
-        return "\n".join(lines)
+        out.write("\n")
 
-    def _generate_performance_section(self, data: Dict) -> str:
+    def _generate_performance_section(self, data: Dict, out: TextIO) -> None:
         """生成性能分析"""
-        lines = [
-            "## 二、性能指标分析",
-            ""
-        ]
+        out.write("## 二、性能指标分析\n\n")
 
         # 遍历各维度生成性能数据
         if "performance_summaries" in data:
@@ -179,385 +454,288 @@ class MarkdownReportGenerator:
                 dimension = perf_summary["dimension"]
                 dimension_name_cn = self._translate_dimension(dimension)
 
-                lines.append(f"### {dimension_name_cn} - 性能对比")
-                lines.append("")
+                out.write(f"### {dimension_name_cn} - 性能对比\n\n")
 
                 model_summaries = perf_summary["model_summaries"]
                 models = list(model_summaries.keys())
 
                 # 创建TTFT对比表格
-                lines.append("| 模型 | 平均TTFT | 平均生成速度 | 平均总时间 |")
-                lines.append("|------|---------|------------|----------|")
+                out.write("| 模型 | 平均TTFT | 平均生成速度 | 平均总时间 |\n")
+                out.write("|------|---------|------------|----------|\n")
 
                 for model in models:
                     summary = model_summaries[model]
-                    lines.append(
+                    out.write(
                         f"| {model.capitalize()} | {summary['ttft_mean']:.1f}ms | "
-                        f"{summary['speed_mean']:.2f} t/s | {summary['total_time_mean']:.1f}ms |"
+                        f"{summary['speed_mean']:.2f} t/s | {summary['total_time_mean']:.1f}ms |\n"
                     )
 
-                lines.append("")
+                out.write("\n")
 
                 # TTFT对比图
                 ttft_data = {model: model_summaries[model]["ttft_mean"] for model in models}
-                lines.append(self._create_bar_chart(ttft_data, "TTFT对比"))
-
-        return "\n".join(lines)
+                self._create_bar_chart(out, ttft_data, "TTFT对比")
 
-    def _generate_quality_section(self, data: Dict) -> str:
+    def _generate_quality_section(self, data: Dict, out: TextIO) -> None:
         """生成质量评估"""
-        lines = [
-            "## 三、质量评估分析",
-            ""
-        ]
+        out.write("## 三、质量评估分析\n\n")
 
         # Judge评估信息
         if "quality_evaluations" in data:
             qe = data["quality_evaluations"]
 
-            lines.append("### Judge 评估概览")
-            lines.append("")
-            lines.append("| Judge | 权重 |")
-            lines.append("|-------|------|")
+            out.write("### Judge 评估概览\n\n")
+            out.write("| Judge | 权重 |\n")
+            out.write("|-------|------|\n")
 
             for judge, weight in qe.get("judge_weights", {}).items():
                 judge_name = judge.replace("_", " ").title()
-                lines.append(f"| {judge_name} | {weight:.0%} |")
+                out.write(f"| {judge_name} | {weight:.0%} |\n")
 
-            lines.append("")
+            out.write("\n")
 
         # 多维雷达图
-        quality_scores = data["quality_scores"]
-        dimension_scores = {}
-        for model, scores in quality_scores.items():
-            for dim, score in scores["dimension_scores"].items():
-                if dim not in dimension_scores:
-                    dimension_scores[dim] = {}
-                dimension_scores[dim][model] = {"score": score}
+        models = self._models
+        dimension_scores = {
+            dim: {model: {"score": score} for model, score in zip(models, column)}
+            for dim, column in zip(self._dims, self._score_mat.T.tolist())
+        }
 
         if dimension_scores:
-            lines.append(self._create_radar_chart_text(dimension_scores, "多维能力对比"))
-
-        return "\n".join(lines)
+            self._create_radar_chart_text(out, dimension_scores, "多维能力对比")
 
-    def _generate_dimension_section(self, data: Dict) -> str:
+    def _generate_dimension_section(self, data: Dict, out: TextIO) -> None:
         """生成维度详细分析"""
-        lines = [
-            "## 四、维度详细分析",
-            ""
-        ]
+        out.write("## 四、维度详细分析\n\n")
 
         quality_scores = data["quality_scores"]
-        performance_summaries = {ps["dimension"]: ps for ps in data.get("performance_summaries", [])}
-
-        dimensions = list(quality_scores[list(quality_scores.keys())[0]]["dimension_scores"].keys())
+        models = self._models
 
-        for dimension in dimensions:
+        for dimension, column in zip(self._dims, self._score_mat.T.tolist()):
             dimension_name_cn = self._translate_dimension(dimension)
-            lines.append(f"### {dimension_name_cn}")
-            lines.append("")
-
-            models = list(quality_scores.keys())
+            out.write(f"### {dimension_name_cn}\n\n")
 
             # 维度得分表格
-            lines.append("| 模型 | 得分 | 评价 |")
-            lines.append("|------|------|------|")
-
-            for model in models:
-                score = quality_scores[model]["dimension_scores"][dimension]
+            out.write("| 模型 | 得分 | 评价 |\n")
+            out.write("|------|------|------|\n")
 
+            for model, score in zip(models, column):
                 # 生成评价
-                if score >= 9.0:
-                    evaluation = "优秀"
-                elif score >= 7.5:
-                    evaluation = "良好"
-                elif score >= 6.0:
-                    evaluation = "合格"
-                else:
-                    evaluation = "待改进"
+                evaluation = _EVAL_LABELS[bisect_right(_EVAL_THRESHOLDS, score)]
 
-                lines.append(f"| {model.capitalize()} | {score:.2f}/10 | {evaluation} |")
+                out.write(f"| {model.capitalize()} | {score:.2f}/10 | {evaluation} |\n")
 
-            lines.append("")
+            out.write("\n")
 
             # 优劣势
             for model in models:
                 model_data = quality_scores[model]
                 if model_data.get("strengths") or model_data.get("weaknesses"):
-                    lines.append(f"**{model.capitalize()}**:")
+                    out.write(f"**{model.capitalize()}**:\n")
 
                     if model_data.get("strengths"):
-                        lines.append("- ✅ 优势: " + "、".join(model_data["strengths"]))
+                        out.write("- ✅ 优势: " + "、".join(model_data["strengths"]) + "\n")
 
                     if model_data.get("weaknesses"):
-                        lines.append("- ⚠️  注意: " + "、".join(model_data["weaknesses"]))
+                        out.write("- ⚠️  注意: " + "、".join(model_data["weaknesses"]) + "\n")
 
-                    lines.append("")
+                    out.write("\n")
 
             # 分数对比图
-            scores = {model: quality_scores[model]["dimension_scores"][dimension] for model in models}
-            lines.append(self._create_progress_bars(scores, f"{dimension_name_cn}得分"))
-
-            lines.append("")
+            scores = dict(zip(models, column))
+            self._create_progress_bars(out, scores, f"{dimension_name_cn}得分")
 
-        return "\n".join(lines)
+            out.write("\n")
 
-    def _generate_recommendations_section(self, data: Dict) -> str:
+    def _generate_recommendations_section(self, data: Dict, out: TextIO) -> None:
         """生成使用建议"""
-        lines = [
-            "## 五、使用建议",
-            ""
-        ]
+        out.write("## 五、使用建议\n\n")
 
         quality_scores = data["quality_scores"]
 
         # 为每个模型生成建议
         for model, scores in quality_scores.items():
-            lines.append(f"### {model.capitalize()} 使用建议")
-            lines.append("")
+            out.write(f"### {model.capitalize()} 使用建议\n\n")
 
             overall_score = scores["overall_score"]
 
             if scores.get("recommendations"):
                 for rec in scores["recommendations"]:
-                    lines.append(f"- {rec}")
+                    out.write(f"- {rec}\n")
 
-            lines.append("")
+            out.write("\n")
 
-        return "\n".join(lines)
-
-    def _generate_methodology_section(self, data: Dict) -> str:
+    def _generate_methodology_section(self, data: Dict, out: TextIO) -> None:
         """生成评测方法论"""
-        lines = [
-            "## 六、评测方法论",
-            ""
-        ]
-
-        # 测试设计
-        lines.append("### 测试设计")
-        lines.append("")
-        metadata = data["metadata"]
-        stats = data["statistics"]
-
-        lines.append(f"- **测试用例总数**: {metadata['total_tests']}")
-        lines.append(f"- **测试维度**: 4个")
-        lines.append(f"- **成功率**: {stats['success_rate']*100:.1f}%")
-        lines.append("")
-
-        # 维度权重
-        lines.append("### 维度权重")
-        lines.append("")
-        lines.append("| 维度 | 权重 | 说明 |")
-        lines.append("|------|------|------|")
-
-        dimension_translations = {
-            "basic_performance": ("基础性能", "响应速度、稳定性"),
-            "core_capabilities": ("核心能力", "推理、理解、生成能力"),
-            "practical_scenarios": ("实用场景", "实际应用表现"),
-            "advanced_features": ("高级特性", "创造性、多轮对话等")
-        }
-
-        for dim, weight in data["dimension_weights"].items():
-            cn_name, desc = dimension_translations.get(dim, (dim, ""))
-            lines.append(f"| {cn_name} | {weight:.0%} | {desc} |")
-
-        lines.append("")
+        out.write(_render_methodology(
+            tuple(data["dimension_weights"].items()),
+            data["metadata"]['total_tests'],
+            data["statistics"]['success_rate']
+        ))
 
-        return "\n".join(lines)
-
-    def _generate_raw_data_section(self, data: Dict) -> str:
+    def _generate_raw_data_section(self, data: Dict, out: TextIO) -> None:
         """生成原始数据摘要"""
-        lines = [
-            "## 七、原始数据摘要",
-            ""
-        ]
-
-        # 测试执行情况
-        lines.append("### 测试执行情况")
-        lines.append("")
+        # 测试执行情况 + 模型配置标题
         stats = data["statistics"]
-
-        lines.append("| 指标 | 数值 |")
-        lines.append("|------|------|")
-        lines.append(f"| 总测试数 | {stats['total_tests']} |")
-        lines.append(f"| 成功执行 | {stats['successful_tests']} |")
-        lines.append(f"| 执行失败 | {stats['failed_tests']} |")
-        lines.append(f"| 成功率 | {stats['success_rate']*100:.1f}% |")
-        lines.append("")
-
-        # 模型配置
-        lines.append("### 模型配置")
-        lines.append("")
+        out.write(_RAW_DATA_TMPL.format(
+            total_tests=stats['total_tests'],
+            successful_tests=stats['successful_tests'],
+            failed_tests=stats['failed_tests'],
+            success_rate=stats['success_rate'] * 100
+        ))
 
         config = data.get("config_snapshot", {})
         if "apis" in config:
-            lines.append("| 模型 | API端点 | 模型名称 |")
-            lines.append("|------|---------|---------|")
-
-            for model_name, api_config in config["apis"].items():
-                lines.append(
+            out.write(
+                "| 模型 | API端点 | 模型名称 |\n"
+                "|------|---------|---------|\n"
+                + "".join(
                     f"| {model_name.capitalize()} | {api_config.get('base_url', 'N/A')} | "
-                    f"{api_config.get('model', 'N/A')} |"
+                    f"{api_config.get('model', 'N/A')} |\n"
+                    for model_name, api_config in config["apis"].items()
                 )
+            )
 
-        lines.append("")
-
-        return "\n".join(lines)
+        out.write("\n")
 
-    def _generate_appendix_section(self, data: Dict) -> str:
+    def _generate_appendix_section(self, data: Dict, out: TextIO) -> None:
         """生成附录"""
-        lines = [
-            "---",
-            "",
-            "## 附录",
-            ""
-        ]
-
-        # 评分等级定义
-        lines.append("### 附录A: 评分等级定义")
-        lines.append("")
-        lines.append("| 等级 | 分数范围 |")
-        lines.append("|------|---------|")
-        lines.append("| 🟢 优秀 | 9.0-10.0 |")
-        lines.append("| 🟢 良好 | 7.5-8.9 |")
-        lines.append("| 🟡 合格 | 6.0-7.4 |")
-        lines.append("| 🔴 不合格 | 3.0-5.9 |")
-        lines.append("| 🔴 严重缺陷 | 0-2.9 |")
-        lines.append("")
-
-        # 数据文件
-        lines.append("### 附录B: 数据文件")
-        lines.append("")
         metadata = data["metadata"]
-        lines.append(f"**JSON原始数据**: `{self.output_dir.name}/{metadata['report_id']}.json`")
-        lines.append("**完整配置**: `config.yaml`")
-        lines.append("**测试用例定义**: `src/tests/cases_minimax/`")
-        lines.append("")
-
-        lines.append("---")
-        lines.append("")
-        lines.append("*报告生成工具: DeepSeek vs GLM MiniMax 评测系统 v2.0*")
-        lines.append(f"*生成时间: {metadata['start_time']}*")
-
-        return "\n".join(lines)
+        out.write(_render_appendix(
+            self.output_dir.name, metadata['report_id'], metadata['start_time']
+        ))
 
     # =========================================================================
     # 图表生成方法（10种）
     # =========================================================================
 
-    def _create_bar_chart(self, values: Dict[str, float], title: str,
-                         bar_width: int = 40) -> str:
+    def _render_chart(self, out: TextIO, kind: str, title: str, labels: Sequence[str],
+                      values: Any, scale: float, width: int = None,
+                      head: Sequence[str] = (), tail: Sequence[str] = ()) -> None:
+        """
+        按 _CHART_SPECS 中的规格渲染图表
+
+        归一化、分档和条长计算对所有图表一次向量化完成，各图表只提供行格式化函数
+
+        Args:
+            out: 文本输出流
+            kind: 图表类型（_CHART_SPECS 的键）
+            title: 图表标题
+            labels: 行标签
+            values: 数值（一维，或每行一组数值的二维数组）
+            scale: 刻度上限（<= 0 时条长均为 0）
+            width: 满刻度字符数，默认取规格中的值
+            head: 数据行之前的附加行
+            tail: 数据行之后的附加行
+        """
+        spec = _CHART_SPECS[kind]
+        if width is None:
+            width = spec.width
+
+        arr = np.asarray(values, dtype=np.float64)
+        if scale > 0:
+            measures = arr / scale * width
+        else:
+            # 全零（或全负）数据没有可用的刻度，条长统一为 0，避免除零
+            measures = np.zeros_like(arr)
+        # 负值不绘制条形（负数切片会从缓冲区尾部截取）
+        lengths = np.maximum((measures / spec.step).astype(np.int64), 0)
+        idx = np.searchsorted(np.multiply(scale, spec.thresholds), arr, side=spec.side)
+
+        out.write(f"\n### {title}\n\n```\n")
+        out.writelines(f"{line}\n" for line in head)
+        out.writelines(
+            f"{spec.row(*row)}\n"
+            for row in zip(labels, arr.tolist(), measures.tolist(), lengths.tolist(), idx.tolist())
+        )
+        out.writelines(f"{line}\n" for line in tail)
+        out.write(f"{spec.closing}\n")
+        if spec.legend:
+            out.write(f"{spec.legend}\n")
+
+    def _create_bar_chart(self, out: TextIO, values: Dict[str, float], title: str,
+                         bar_width: int = 40) -> None:
         """创建精细ASCII柱状图，带刻度和网格"""
         if not values:
-            return ""
-
-        max_val = max(values.values())
-        lines = [f"\n### {title}\n"]
-        lines.append("```")
-
-        # 顶部边框
-        lines.append(f"{'':>12} {'█' * bar_width}")
-        lines.append(f"{max_val:>10.1f} ┌{'─' * bar_width}┐")
-
-        # 数据条
-        for label, value in values.items():
-            bar_length = int(value / max_val * bar_width)
-
-            # 使用不同字符表示密度
-            if value >= max_val * 0.8:
-                bar_char = "█"
-            elif value >= max_val * 0.6:
-                bar_char = "▓"
-            elif value >= max_val * 0.4:
-                bar_char = "▒"
-            else:
-                bar_char = "░"
-
-            bar = bar_char * bar_length
-            lines.append(f"{'':>12} │{bar}│ {label}: {value:.2f}")
-
-        # 底部边框
-        lines.append(f"{'':>12} └{'─' * bar_width}┘")
-        lines.append(f"{'0.0':>10}  ")
-        lines.append("```")
-
-        return "\n".join(lines)
-
-    def _create_horizontal_bar_chart(self, data: Dict[str, Dict],
-                                      metric: str, title: str) -> str:
-        """创建水平对比条形图"""
-        if not data:
-            return ""
+            return
 
-        lines = [f"\n### {title}\n"]
-        lines.append("```\n")
+        # 只取一次数值列表，最大值为 0 时由 _render_chart 统一处理
+        vals = list(values.values())
+        max_val = max(vals)
 
-        for label, values in data.items():
-            lines.append(f"\n**{label}**")
-            for model, value in values.items():
-                max_val = max(v for vals in data.values() for v in vals.values())
-                bar_length = int(value / max_val * 30) if max_val > 0 else 0
+        # 顶部/底部边框（横线复用）
+        rule = _BARS["─"][:bar_width]
+        head = (f"{'':>12} {_BARS['█'][:bar_width]}", f"{max_val:>10.1f} ┌{rule}┐")
+        tail = (f"{'':>12} └{rule}┘", f"{'0.0':>10}  ")
 
-                # 不同模型使用不同字符
-                if model == "deepseek":
-                    bar = "▓" * bar_length
-                else:
-                    bar = "█" * bar_length
+        self._render_chart(out, "bar", title, list(values), vals,
+                           max_val, width=bar_width, head=head, tail=tail)
 
-                lines.append(f"  {model:12} {bar} {value:.2f}")
+    def _create_horizontal_bar_chart(self, out: TextIO, data: Dict[str, Dict],
+                                      metric: str, title: str) -> None:
+        """创建水平对比条形图"""
+        if not data:
+            return
+
+        # 全局最大值与行无关，循环外用一次 NumPy 归约计算
+        all_values = np.fromiter(
+            (v for vals in data.values() for v in vals.values()), dtype=np.float64
+        )
+        max_val = float(all_values.max()) if all_values.size else 0.0
+
+        def bar(model: str, value: float) -> str:
+            bar_length = int(value / max_val * 30) if max_val > 0 else 0
+            # 不同模型使用不同字符
+            return _BARS["▓" if model == "deepseek" else "█"][:bar_length]
+
+        body = "".join(
+            f"\n\n**{label}**" + "".join(
+                f"\n  {model:12} {bar(model, value)} {value:.2f}"
+                for model, value in values.items()
+            )
+            for label, values in data.items()
+        )
 
-        lines.append("\n```")
-        return "\n".join(lines)
+        out.write(f"\n### {title}\n\n```\n{body}\n\n```\n")
 
-    def _create_radar_chart_text(self, quality_scores: Dict, title: str = "") -> str:
+    def _create_radar_chart_text(self, out: TextIO, quality_scores: Dict, title: str = "") -> None:
         """创建雷达图的文本表示"""
         if not quality_scores:
-            return ""
-
-        lines = [f"\n### {title}\n"]
+            return
 
         # 获取所有维度和模型
         dimensions = list(quality_scores.keys())
         if not dimensions:
-            return ""
+            return
 
         models = list(quality_scores[dimensions[0]].keys())
 
-        # 为每个模型生成雷达图文本
-        for model in models:
-            lines.append(f"\n**{model.upper()}**")
-            lines.append("```")
-
+        def model_block(model: str) -> str:
             scores = []
             for dim in dimensions:
                 score_data = quality_scores[dim][model]
                 score = score_data["score"] if isinstance(score_data, dict) else score_data
                 scores.append((dim, score))
 
-            # 按分数排序
+            # 按分数排序，每个维度一条10级刻度条
             scores.sort(key=lambda x: x[1], reverse=True)
+            rows = "".join(
+                f"\n  {self._translate_dimension(dim):20} [{_score_bar(score)}] {score:.1f}/10"
+                for dim, score in scores
+            )
+            return f"\n\n**{model.upper()}**\n```{rows}\n```"
 
-            for dim, score in scores:
-                # 创建10级刻度条
-                bar_len = int(score / 10 * 20)
-                bar = "█" * bar_len + "░" * (20 - bar_len)
-
-                # 翻译维度名
-                dim_cn = self._translate_dimension(dim)
-                lines.append(f"  {dim_cn:20} [{bar}] {score:.1f}/10")
-
-            lines.append("```")
-
-        return "\n".join(lines)
+        out.write(f"\n### {title}\n")
+        out.writelines(model_block(model) for model in models)
+        out.write("\n")
 
-    def _create_line_chart(self, data_points: List[float],
-                           labels: List[str], title: str) -> str:
+    def _create_line_chart(self, out: TextIO, data_points: List[float],
+                           labels: List[str], title: str) -> None:
         """创建ASCII折线图显示趋势"""
         if not data_points:
-            return ""
+            return
 
-        lines = [f"\n### {title}\n"]
-        lines.append("```")
+        out.write(f"\n### {title}\n\n```\n")
 
         max_val = max(data_points)
         min_val = min(data_points)
@@ -576,269 +754,163 @@ class MarkdownReportGenerator:
                 else:
                     line += "     "
 
-            lines.append(line)
+            out.write(line + "\n")
 
         # 添加X轴标签
-        lines.append("       └" + "─────" * len(data_points))
+        out.write("       └" + "─────" * len(data_points) + "\n")
         label_line = "        "
         for label in labels:
             label_cn = self._translate_dimension(label)[:4]
             label_line += f"{label_cn:^5}"
-        lines.append(label_line)
+        out.write(label_line + "\n")
 
-        lines.append("```")
-        return "\n".join(lines)
+        out.write("```\n")
 
-    def _create_stacked_bar(self, quality_scores: Dict,
-                            dimension_weights: Dict, title: str) -> str:
+    def _create_stacked_bar(self, out: TextIO, quality_scores: Dict,
+                            dimension_weights: Dict, title: str) -> None:
         """创建堆叠条形图，显示各维度对总分的贡献"""
         if not quality_scores:
-            return ""
+            return
 
-        lines = [f"\n### {title}\n"]
-        lines.append("```\n")
+        def dim_row(dim_name: str, score: float) -> str:
+            weight = dimension_weights[dim_name]
+            weighted = score * weight
 
-        for model_name, scores in quality_scores.items():
-            overall = scores["overall_score"]
-            lines.append(f"**{model_name}** (总分: {overall:.2f}/10)")
+            # 根据权重使用不同符号（高权重 █，中等 ▓，低 ▒）
+            char = _WEIGHT_CHARS[bisect_right(_WEIGHT_THRESHOLDS, weight)]
+            bar = _BARS[char][:int(score / 10 * 30)]
 
+            dim_cn = self._translate_dimension(dim_name)
+            return f"\n  {dim_cn:20} ({weight * 100:2.0f}%) [{bar}] {score:.2f} → {weighted:.2f}"
+
+        body = "".join(
+            f"\n**{model_name}** (总分: {scores['overall_score']:.2f}/10)"
             # 按权重排序维度
-            sorted_dims = sorted(
+            + "".join(dim_row(dim_name, score) for dim_name, score in sorted(
                 scores["dimension_scores"].items(),
                 key=lambda x: dimension_weights[x[0]],
                 reverse=True
-            )
+            ))
+            + "\n"
+            for model_name, scores in quality_scores.items()
+        )
 
-            for dim_name, score in sorted_dims:
-                weight = dimension_weights[dim_name]
-                weighted = score * weight
+        out.write(f"\n### {title}\n\n```\n{body}\n```\n**图例**: ██(35%) ▓▓(25%) ▒▒(15%)\n")
 
-                # 计算条形长度
-                bar_len = int(score / 10 * 30)
-
-                # 根据权重使用不同符号
-                if weight >= 0.35:
-                    char = "█"  # 高权重
-                elif weight >= 0.25:
-                    char = "▓"  # 中等权重
-                else:
-                    char = "▒"  # 低权重
-
-                bar = char * bar_len
-                pct = weight * 100
-
-                dim_cn = self._translate_dimension(dim_name)
-                lines.append(
-                    f"  {dim_cn:20} ({pct:2.0f}%) "
-                    f"[{bar}] {score:.2f} → {weighted:.2f}"
-                )
-
-            lines.append("")
-
-        lines.append("```")
-        lines.append("**图例**: ██(35%) ▓▓(25%) ▒▒(15%)")
-
-        return "\n".join(lines)
-
-    def _create_comparison_matrix(self, data: Dict) -> str:
+    def _create_comparison_matrix(self, out: TextIO, data: Dict) -> None:
         """创建详细的对比矩阵"""
         if not data or "quality_scores" not in data:
-            return ""
+            return
 
         quality_scores = data["quality_scores"]
         models = list(quality_scores.keys())
 
         if not models:
-            return ""
-
-        lines = ["\n### 模型对比矩阵\n"]
+            return
 
-        # 表头
-        header = "| 指标 |"
-        for model in models:
-            header += f" {model.capitalize()} |"
-        lines.append(header)
-
-        separator = "|------|"
-        for _ in models:
-            separator += "---------|"
-        lines.append(separator)
-
-        # 维度得分行
         dimensions = list(quality_scores[models[0]]["dimension_scores"].keys())
 
-        for dim in dimensions:
-            row = f"| {dim} |"
-            for model in models:
-                score = quality_scores[model]["dimension_scores"][dim]
-                # 使用颜色标记
-                if score >= 9.0:
-                    emoji = "🟢"
-                elif score >= 7.5:
-                    emoji = "🟢"
-                elif score >= 6.0:
-                    emoji = "🟡"
-                else:
-                    emoji = "🔴"
-                row += f" {emoji} {score:.2f} |"
-            lines.append(row)
-
-        # 总分行
-        total_row = "| **总分** |"
-        for model in models:
-            score = quality_scores[model]["overall_score"]
-            total_row += f" **{score:.2f}** |"
-        lines.append(total_row)
-
-        return "\n".join(lines)
-
-    def _create_scatter_plot(self, performance_data: List,
-                             quality_data: List, title: str) -> str:
+        def score_cell(score: float) -> str:
+            # 使用颜色标记
+            return f" {_EVAL_EMOJIS[bisect_right(_EVAL_THRESHOLDS, score)]} {score:.2f} |"
+
+        out.writelines(f"{line}\n" for line in [
+            "\n### 模型对比矩阵\n",
+            # 表头
+            "| 指标 |" + "".join(f" {model.capitalize()} |" for model in models),
+            "|------|" + "---------|" * len(models),
+            # 维度得分行
+            *(
+                f"| {dim} |" + "".join(
+                    score_cell(quality_scores[model]["dimension_scores"][dim]) for model in models
+                )
+                for dim in dimensions
+            ),
+            # 总分行
+            "| **总分** |" + "".join(
+                f" **{quality_scores[model]['overall_score']:.2f}** |" for model in models
+            ),
+        ])
+
+    def _create_scatter_plot(self, out: TextIO, performance_data: List,
+                             quality_data: List, title: str) -> None:
         """创建性能vs质量散点图"""
         if not performance_data or not quality_data:
-            return ""
+            return
 
-        lines = [f"\n### {title}\n"]
-        lines.append("```")
-
-        # 定义网格
+        # 映射数据点到网格（任一轴全为 0 时不绘制数据点）
         grid_size = 15
-        grid = [[" " for _ in range(grid_size)] for _ in range(grid_size)]
-
-        # 映射数据点到网格
-        model_labels = ["A", "B"]
-        for i, (perf, qual) in enumerate(zip(performance_data, quality_data)):
-            if max(performance_data) > 0 and max(quality_data) > 0:
-                x = int((perf / max(performance_data)) * (grid_size - 1))
-                y = int((qual / max(quality_data)) * (grid_size - 1))
-                if 0 <= x < grid_size and 0 <= y < grid_size:
-                    grid[grid_size - 1 - y][x] = model_labels[i % len(model_labels)]
-
-        # Y轴标签
-        lines.append(f"{'质量':^4} ↑")
-
-        # 绘制网格
-        for row in grid:
-            line = "     │" + "".join(row) + "│"
-            lines.append(line)
-
-        # X轴标签
-        lines.append("     └" + "─" * grid_size + "→")
-        lines.append(f"{'':>10}性能\n")
-
-        # 图例
-        lines.append("**图例**: A = DeepSeek, B = GLM")
-        lines.append("右上角 = 高质量高性能")
-
-        lines.append("```")
-        return "\n".join(lines)
-
-    def _create_timeline_comparison(self, time_data: Dict[str, List[float]],
-                                    title: str) -> str:
-        """创建时间轴对比图"""
+        perf = np.asarray(performance_data, dtype=np.float64)
+        qual = np.asarray(quality_data, dtype=np.float64)
+        max_perf = float(perf.max())
+        max_qual = float(qual.max())
+        if max_perf > 0 and max_qual > 0:
+            grid = _fill_scatter_grid(perf, qual, grid_size, max_perf, max_qual)
+        else:
+            grid = np.full((grid_size, grid_size), -1, np.int8)
+
+        # 网格行 + Y/X 轴标签 + 图例
+        rows = "\n".join(
+            "     │" + "".join([_SCATTER_CELLS[v + 1] for v in row]) + "│"
+            for row in grid.tolist()
+        )
+
+        out.write(
+            f"\n### {title}\n\n```\n"
+            f"{'质量':^4} ↑\n"
+            f"{rows}\n"
+            f"     └{_BARS['─'][:grid_size]}→\n"
+            f"{'':>10}性能\n\n"
+            "**图例**: A = DeepSeek, B = GLM\n"
+            "右上角 = 高质量高性能\n"
+            "```\n"
+        )
+
+    def _create_timeline_comparison(self, out: TextIO, time_data: Dict[str, List[float]],
+                                    title: str) -> None:
+        """创建时间轴对比图（极快 ▁ / 快 ▂ / 中等 ▃ / 慢 ▄）"""
         if not time_data:
-            return ""
-
-        lines = [f"\n### {title}\n"]
-        lines.append("```")
-
-        max_time = max(max(times) for times in time_data.values() if times)
-
-        for model, times in time_data.items():
-            if not times:
-                continue
+            return
 
-            avg_time = sum(times) / len(times)
-            bar_len = int(avg_time / max_time * 30) if max_time > 0 else 0
+        # 跳过没有数据的模型；全部为空时不输出图表
+        non_empty = [(model, times) for model, times in time_data.items() if times]
+        if not non_empty:
+            return
 
-            # 使用不同字符表示时间长短
-            if avg_time <= max_time * 0.3:
-                bar = "▁" * bar_len  # 极快
-            elif avg_time <= max_time * 0.6:
-                bar = "▂" * bar_len  # 快
-            elif avg_time <= max_time * 0.8:
-                bar = "▃" * bar_len  # 中等
-            else:
-                bar = "▄" * bar_len  # 慢
+        max_time = max(max(times) for _, times in non_empty)
+        labels = [model for model, _ in non_empty]
+        averages = [sum(times) / len(times) for _, times in non_empty]
 
-            lines.append(f"{model:12} {bar} {avg_time:.0f}ms")
+        self._render_chart(out, "timeline", title, labels, averages, max_time)
 
-        lines.append("\n```")
-        lines.append("**图例**: ▁≤30% ▂≤60% ▃≤80% ▄>80%")
-
-        return "\n".join(lines)
-
-    def _create_progress_bars(self, data: Dict[str, float],
-                             title: str, max_val: float = 10.0) -> str:
-        """创建百分比进度条"""
+    def _create_progress_bars(self, out: TextIO, data: Dict[str, float],
+                             title: str, max_val: float = 10.0) -> None:
+        """创建百分比进度条（每5%一个字符）"""
         if not data:
-            return ""
-
-        lines = [f"\n### {title}\n"]
-        lines.append("```")
-
-        for label, score in data.items():
-            percentage = (score / max_val) * 100
-            filled = int(percentage / 5)  # 每5%一个字符
-
-            # 使用不同颜色字符
-            if percentage >= 90:
-                fill_char = "█"
-            elif percentage >= 75:
-                fill_char = "▓"
-            elif percentage >= 60:
-                fill_char = "▒"
-            else:
-                fill_char = "░"
+            return
 
-            bar = fill_char * filled + "░" * (20 - filled)
-            lines.append(f"{label:20} [{bar}] {percentage:5.1f}% ({score:.2f})")
+        self._render_chart(out, "progress", title, list(data), list(data.values()), max_val)
 
-        lines.append("\n```")
-        return "\n".join(lines)
-
-    def _create_heatmap(self, data: Dict[str, Dict[str, float]],
-                       title: str) -> str:
+    def _create_heatmap(self, out: TextIO, data: Dict[str, Dict[str, float]],
+                       title: str) -> None:
         """创建ASCII热力图"""
         if not data:
-            return ""
-
-        lines = [f"\n### {title}\n"]
-        lines.append("```")
+            return
 
         models = list(data.keys())
         metrics = list(data[models[0]].keys()) if models else []
 
         # 表头
-        header = "         "
-        for model in models:
-            header += f"{model.capitalize():^10}"
-        lines.append(header)
-        lines.append("-" * len(header))
-
-        # 数据行
-        for metric in metrics:
-            line = f"{metric:10}"
-            for model in models:
-                value = data[model][metric]
-                # 根据数值选择密度字符
-                if value >= 9.0:
-                    cell = "██████████"
-                elif value >= 8.0:
-                    cell = "▓▓▓▓▓▓▓▓▓"
-                elif value >= 7.0:
-                    cell = "▒▒▒▒▒▒▒▒▒"
-                elif value >= 6.0:
-                    cell = "░░░░░░░░░░"
-                else:
-                    cell = "··········"
-                line += f"{cell:^10}"
-            lines.append(line)
+        header = "         " + "".join(f"{model.capitalize():^10}" for model in models)
 
-        lines.append("```")
-        lines.append("**密度**: █=9.0+ ▓=8.0+ ▒=7.0+ ░=6.0+ ·=<6.0")
+        # 数值矩阵 (metrics × models)，按绝对分值分档
+        values = np.array(
+            [[data[model][metric] for model in models] for metric in metrics],
+            dtype=np.float64
+        ).reshape(len(metrics), len(models))
 
-        return "\n".join(lines)
+        self._render_chart(out, "heatmap", title, metrics, values, 1.0,
+                           head=(header, "-" * len(header)))
 
     # =========================================================================
     # 辅助方法
@@ -848,6 +920,8 @@ class MarkdownReportGenerator:
         """获取等级emoji（使用 GradeFormatter）"""
         return GradeFormatter.get_grade_emoji(grade)
 
-    def _translate_dimension(self, dim_name: str) -> str:
-        """翻译维度名称（使用 DimensionTranslator）"""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _translate_dimension(dim_name: str) -> str:
+        """翻译维度名称（使用 DimensionTranslator，维度集合很小，结果缓存复用）"""
         return DimensionTranslator.translate(dim_name)
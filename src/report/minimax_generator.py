@@ -11,18 +11,24 @@
 import os
 import json
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import ClassVar, Dict, List, Any, Optional
 from pathlib import Path
 
-# 尝试导入 plotly，如果不可用则跳过可视化功能
+import numpy as np
+
+# plotly 延迟到首次生成可视化时再导入（会加载上百个子模块），只生成文本报告时无需承担导入开销
+# PLOTLY_AVAILABLE 为 None 表示尚未尝试导入
+go = None
+PLOTLY_AVAILABLE: Optional[bool] = None
+
+# 尝试导入 orjson（C 实现，序列化大段 Markdown 内容更快），不可用时回退到标准库 json
 try:
-    import plotly.graph_objects as go
-    import numpy as np
-    PLOTLY_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PLOTLY_AVAILABLE = False
-    go = None
-    np = None
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 from .generator import ReportGenerator
 from .color_schemes import ColorSchemes, get_model_color, get_score_color
@@ -35,9 +41,44 @@ from .formatters import (
 )
 
 
+def _load_plotly() -> bool:
+    """导入 plotly（仅首次调用时真正导入），返回是否可用"""
+    global go, PLOTLY_AVAILABLE
+    if PLOTLY_AVAILABLE is None:
+        try:
+            import plotly.graph_objects as graph_objects
+            go = graph_objects
+            PLOTLY_AVAILABLE = True
+        except ImportError:
+            PLOTLY_AVAILABLE = False
+    return PLOTLY_AVAILABLE
+
+
+# 图表 HTML 片段：plotly.js 通过 CDN 引用而不是每张图内联约 3MB 的脚本，且只输出 <div> 片段
+_PLOTLY_HTML_OPTIONS = {"include_plotlyjs": "cdn", "full_html": False}
+
+# 10分制等级分档（由 GradeFormatter 阈值派生）：np.digitize 的结果即为 _GRADE_LABELS 下标
+_GRADE_LABELS = tuple(sorted(GradeFormatter.GRADE_THRESHOLDS_10, key=GradeFormatter.GRADE_THRESHOLDS_10.get))
+_GRADE_BINS = np.array(sorted(GradeFormatter.GRADE_THRESHOLDS_10.values())[1:])
+
+# 报告文件写缓冲大小（默认缓冲区通常只有 st_blksize，约 4KB）
+_WRITE_BUFFER_SIZE = 1 << 17
+
+
 class MiniMaxReportGenerator(ReportGenerator):
     """MiniMax 标准报告生成器"""
 
+    # 维度 → 应用场景建议
+    _SCENARIO_MAP: ClassVar[Dict[str, str]] = {
+        "basic_performance": "对实时性要求高的场景，如在线对话、实时响应",
+        "core_capabilities": "需要复杂推理和代码生成的场景，如编程辅助、问题解决",
+        "practical_scenarios": "专业领域的实际应用，如咨询、分析、文档处理",
+        "advanced_features": "需要创新思维和复杂推理的高级应用场景"
+    }
+
+    # 瀑布图维度权重（基础性能、核心能力、实用场景、高级特性）
+    _WATERFALL_WEIGHTS: ClassVar[np.ndarray] = np.array([0.25, 0.35, 0.25, 0.15])
+
     def __init__(self, config: Dict[str, Any]):
         """
         初始化 MiniMax 报告生成器
@@ -49,6 +90,14 @@ class MiniMaxReportGenerator(ReportGenerator):
         self.output_dir = Path(config.get("output_dir", "results/minimax_reports"))
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # 图表用到的模型颜色只解析一次，各图表直接查表
+        # 键为 "模型" (primary) 或 "模型_色调"，如 "deepseek_rgba_medium"
+        self._color_cache: Dict[str, str] = {}
+        for model in ("deepseek", "glm"):
+            self._color_cache[model] = get_model_color(model)
+            for shade in ("rgba_medium", "rgba_light"):
+                self._color_cache[f"{model}_{shade}"] = get_model_color(model, shade)
+
     def generate_minimax_report(
         self,
         statistics: Dict[str, Any],
@@ -70,12 +119,14 @@ class MiniMaxReportGenerator(ReportGenerator):
         Returns:
             str: 生成的报告文件路径
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_name = f"minimax_report_{timestamp}"
+        # 只读取一次当前时间，文件名、正文时间戳和 JSON 元数据共用
+        now = datetime.now()
+        ts_human = now.strftime("%Y-%m-%d %H:%M:%S")
+        report_name = f"minimax_report_{now.strftime('%Y%m%d_%H%M%S')}"
 
         # 生成各部分
         summary = self._generate_summary(
-            statistics, quality_scores, model_names
+            statistics, quality_scores, model_names, ts_human
         )
 
         performance_analysis = self._generate_performance_analysis(
@@ -94,18 +145,19 @@ class MiniMaxReportGenerator(ReportGenerator):
             statistics, quality_scores, model_names
         )
 
-        # 组合完整报告
-        report = self._assemble_report(
+        # 组合完整报告（按片段交给 _save_report 顺序写出，不预先拼接）
+        chunks = self._assemble_report(
             summary=summary,
             performance_analysis=performance_analysis,
             quality_analysis=quality_analysis,
             dimension_analysis=dimension_analysis,
             recommendations=recommendations,
-            model_names=model_names
+            model_names=model_names,
+            generated_at=ts_human
         )
 
         # 保存报告
-        report_path = self._save_report(report_name, report)
+        report_path = self._save_report(report_name, chunks, now)
 
         return report_path
 
@@ -113,12 +165,11 @@ class MiniMaxReportGenerator(ReportGenerator):
         self,
         statistics: Dict[str, Any],
         quality_scores: Dict[str, Any],
-        model_names: List[str]
+        model_names: List[str],
+        timestamp: str
     ) -> str:
-        """生成执行摘要"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        summary = f"""# MiniMax 标准评测 - 执行摘要
+        """生成执行摘要（timestamp 为格式化后的评测时间）"""
+        parts = [f"""# MiniMax 标准评测 - 执行摘要
 
 **评测时间**: {timestamp}
 **评测模型**: {', '.join(model_names)}
@@ -128,24 +179,26 @@ class MiniMaxReportGenerator(ReportGenerator):
 
 ## 总体结论
 
-"""
+"""]
 
-        # 计算总体得分
+        # 计算总体得分（成功/总数计数直接取统计结果，不再逐项查找嵌套字典）
+        model_stats = statistics.get('model_stats', {})
         for model_name in model_names:
             model_quality = quality_scores.get(model_name, {})
+            run_stats = model_stats.get(model_name, {})
             overall_score = model_quality.get("overall_score", 0)
             grade = self._get_grade(overall_score)
 
-            summary += f"""### {model_name}
+            parts.append(f"""### {model_name}
 
 - **综合得分**: {overall_score:.2f}/10
 - **等级**: {grade}
-- **测试成功率**: {statistics.get('model_stats', {}).get(model_name, {}).get('success', 0)}/{statistics.get('model_stats', {}).get(model_name, {}).get('total', 0)}
+- **测试成功率**: {run_stats.get('success', 0)}/{run_stats.get('total', 0)}
 
-"""
+""")
 
-        summary += "\n---\n\n"
-        return summary
+        parts.append("\n---\n\n")
+        return "".join(parts)
 
     def _generate_performance_analysis(
         self,
@@ -153,42 +206,44 @@ class MiniMaxReportGenerator(ReportGenerator):
         model_names: List[str]
     ) -> str:
         """生成性能分析"""
-        analysis = "## 性能指标分析\n\n"
+        parts = ["## 性能指标分析\n\n"]
 
-        # 按模型组织数据
-        model_performance = {}
+        # 按模型组织数据：一次扫描完成分组、成功过滤和计数
+        # {模型: {"ttft": [...], "speed": [...], "n": 总数, "ok": 成功数}}
+        model_performance: Dict[str, Dict[str, Any]] = {}
         for result in performance_data:
             model = result.get("model_name")
             if model and model in model_names:
-                if model not in model_performance:
-                    model_performance[model] = []
-                model_performance[model].append(result)
+                bucket = model_performance.setdefault(
+                    model, {"ttft": [], "speed": [], "n": 0, "ok": 0}
+                )
+                bucket["n"] += 1
+                if result.get("success"):
+                    bucket["ok"] += 1
+                    bucket["ttft"].append(result.get("ttft_ms", 0))
+                    bucket["speed"].append(result.get("tokens_per_second", 0))
 
         # 计算各模型性能统计
         for model_name in model_names:
             if model_name not in model_performance:
                 continue
 
-            results = model_performance[model_name]
+            bucket = model_performance[model_name]
+            ttft_values = np.asarray(bucket["ttft"], dtype=np.float64)
+            speed_values = np.asarray(bucket["speed"], dtype=np.float64)
 
-            ttft_values = [r.get("ttft_ms", 0) for r in results if r.get("success")]
-            speed_values = [r.get("tokens_per_second", 0) for r in results if r.get("success")]
-
-            if ttft_values:
-                avg_ttft = sum(ttft_values) / len(ttft_values)
-                min_ttft = min(ttft_values)
-                max_ttft = max(ttft_values)
+            # 均值/最小/最大值由 NumPy 归约计算，无成功记录时均为 0
+            if ttft_values.size:
+                avg_ttft, min_ttft, max_ttft = ttft_values.mean(), ttft_values.min(), ttft_values.max()
             else:
                 avg_ttft = min_ttft = max_ttft = 0
 
-            if speed_values:
-                avg_speed = sum(speed_values) / len(speed_values)
-                min_speed = min(speed_values)
-                max_speed = max(speed_values)
+            if speed_values.size:
+                avg_speed, min_speed, max_speed = speed_values.mean(), speed_values.min(), speed_values.max()
             else:
                 avg_speed = min_speed = max_speed = 0
 
-            analysis += f"""### {model_name}
+            parts.append(f"""### {model_name}
 
 **首次响应时间 (TTFT)**
 - 平均: {avg_ttft:.2f} ms
@@ -198,13 +253,13 @@ class MiniMaxReportGenerator(ReportGenerator):
 - 平均: {avg_speed:.2f} tokens/s
 - 范围: {min_speed:.2f} - {max_speed:.2f} tokens/s
 
-**成功运行**: {len([r for r in results if r.get("success")])}/{len(results)}
+**成功运行**: {bucket["ok"]}/{bucket["n"]}
 
 ---
 
-"""
+""")
 
-        return analysis
+        return "".join(parts)
 
     def _generate_quality_analysis(
         self,
@@ -212,26 +267,27 @@ class MiniMaxReportGenerator(ReportGenerator):
         model_names: List[str]
     ) -> str:
         """生成质量分析"""
-        analysis = "## 质量评估分析\n\n"
+        parts = ["## 质量评估分析\n\n"]
 
         for model_name in model_names:
             model_scores = quality_scores.get(model_name, {})
 
-            analysis += f"""### {model_name}
+            parts.append(f"""### {model_name}
 
 **各维度得分**:
 
-"""
+""")
 
-            # 按维度显示得分
+            # 按维度显示得分（所有维度的等级一次分档得到）
             dimension_scores = model_scores.get("dimension_scores", {})
-            for dimension, score in dimension_scores.items():
-                grade = self._get_grade(score)
-                analysis += f"- **{dimension}**: {score:.2f}/10 ({grade})\n"
+            scores = np.fromiter(dimension_scores.values(), dtype=np.float64, count=len(dimension_scores))
+            grade_idx = np.digitize(scores, _GRADE_BINS).tolist()
+            for (dimension, score), idx in zip(dimension_scores.items(), grade_idx):
+                parts.append(f"- **{dimension}**: {score:.2f}/10 ({_GRADE_LABELS[idx]})\n")
 
-            analysis += "\n"
+            parts.append("\n")
 
-        return analysis
+        return "".join(parts)
 
     def _generate_dimension_analysis(
         self,
@@ -240,32 +296,35 @@ class MiniMaxReportGenerator(ReportGenerator):
         model_names: List[str]
     ) -> str:
         """生成维度分析"""
-        analysis = "## 维度对比分析\n\n"
+        rows = [
+            "| 维度 | 权重 | " + " | ".join(model_names) + " | 优胜者 |",
+            "|------|------| " + " | ".join(["---"] * len(model_names)) + " | ------ |",
+        ]
 
-        analysis += "| 维度 | 权重 | " + " | ".join(model_names) + " | 优胜者 |\n"
-        analysis += "|------|------| " + " | ".join(["---"] * len(model_names)) + " | ------ |\n"
+        # 各模型的维度得分字典只查找一次
+        model_dim_scores = [
+            quality_scores.get(model_name, {}).get("dimension_scores", {})
+            for model_name in model_names
+        ]
 
         for dimension, weight in dimension_weights.items():
             row = [dimension, f"{weight*100:.0f}%"]
 
-            scores = []
-            for model_name in model_names:
-                score = quality_scores.get(model_name, {}).get("dimension_scores", {}).get(dimension, 0)
-                scores.append(score)
-                row.append(f"{score:.2f}")
-
-            # 判断优胜者
-            if len(scores) == 2:
-                winner = model_names[0] if scores[0] > scores[1] else model_names[1]
-                if abs(scores[0] - scores[1]) < 0.1:
-                    winner = "平局"
+            scores = [dim_scores.get(dimension, 0) for dim_scores in model_dim_scores]
+            row.extend(f"{score:.2f}" for score in scores)
+
+            # 判断优胜者（支持任意数量模型：最高分与次高分相差不足 0.1 视为平局）
+            if len(scores) >= 2:
+                best_idx = max(range(len(scores)), key=scores.__getitem__)
+                top, runner_up = sorted(scores, reverse=True)[:2]
+                winner = "平局" if top - runner_up < 0.1 else model_names[best_idx]
             else:
                 winner = "-"
 
             row.append(winner)
-            analysis += "| " + " | ".join(row) + " |\n"
+            rows.append("| " + " | ".join(row) + " |")
 
-        return analysis
+        return "## 维度对比分析\n\n" + "\n".join(rows) + "\n"
 
     def _generate_recommendations(
         self,
@@ -274,10 +333,10 @@ class MiniMaxReportGenerator(ReportGenerator):
         model_names: List[str]
     ) -> str:
         """生成应用建议"""
-        recommendations = "## 应用建议\n\n"
+        parts = ["## 应用建议\n\n"]
 
         # 分析各模型的优势场景
-        recommendations += "### 模型优势分析\n\n"
+        parts.append("### 模型优势分析\n\n")
 
         for model_name in model_names:
             model_scores = quality_scores.get(model_name, {})
@@ -286,15 +345,15 @@ class MiniMaxReportGenerator(ReportGenerator):
             # 找出得分最高的维度
             if dimension_scores:
                 best_dimension = max(dimension_scores.items(), key=lambda x: x[1])
-                recommendations += f"""**{model_name}**
+                parts.append(f"""**{model_name}**
 
 - 最强维度: {best_dimension[0]} ({best_dimension[1]:.2f}/10)
 - 适用场景: {self._get_scenario_recommendation(best_dimension[0])}
 
-"""
+""")
 
         # 添加使用建议
-        recommendations += "\n### 使用建议\n\n"
+        parts.append("\n### 使用建议\n\n")
 
         if len(model_names) == 2:
             model1, model2 = model_names
@@ -302,13 +361,13 @@ class MiniMaxReportGenerator(ReportGenerator):
             score2 = quality_scores.get(model2, {}).get("overall_score", 0)
 
             if abs(score1 - score2) < 0.5:
-                recommendations += f"两个模型整体表现相当，建议根据具体应用场景选择。"
+                parts.append(f"两个模型整体表现相当，建议根据具体应用场景选择。")
             elif score1 > score2:
-                recommendations += f"**{model1}** 整体表现优于 **{model2}**，建议优先选择 {model1}。"
+                parts.append(f"**{model1}** 整体表现优于 **{model2}**，建议优先选择 {model1}。")
             else:
-                recommendations += f"**{model2}** 整体表现优于 {model1}，建议优先选择 {model2}。"
+                parts.append(f"**{model2}** 整体表现优于 {model1}，建议优先选择 {model2}。")
 
-        return recommendations
+        return "".join(parts)
 
     def _assemble_report(
         self,
@@ -317,16 +376,11 @@ class MiniMaxReportGenerator(ReportGenerator):
         quality_analysis: str,
         dimension_analysis: str,
         recommendations: str,
-        model_names: List[str]
-    ) -> str:
-        """组装完整报告"""
-        report = f"""# MiniMax 标准评测报告
-
-{summary}
-{performance_analysis}
-{quality_analysis}
-{dimension_analysis}
-{recommendations}
+        model_names: List[str],
+        generated_at: str
+    ) -> List[str]:
+        """组装完整报告，返回按顺序写出的文本片段（generated_at 为格式化后的生成时间）"""
+        footer = f"""
 
 ---
 
@@ -352,45 +406,55 @@ class MiniMaxReportGenerator(ReportGenerator):
 
 ---
 
-**生成时间**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+**生成时间**: {generated_at}
 **评测模型**: {', '.join(model_names)}
 """
 
-        return report
+        return [
+            "# MiniMax 标准评测报告\n\n",
+            summary, "\n",
+            performance_analysis, "\n",
+            quality_analysis, "\n",
+            dimension_analysis, "\n",
+            recommendations,
+            footer,
+        ]
 
-    def _save_report(self, report_name: str, report_content: str) -> str:
-        """保存报告到文件"""
-        # 保存 Markdown 格式
+    def _save_report(self, report_name: str, chunks: List[str], generated_at: datetime) -> str:
+        """保存报告到文件（chunks 为报告片段，generated_at 写入 JSON 元数据）"""
+        # 保存 Markdown 格式（128KB 写缓冲，片段直接顺序写出，不先拼成整串）
         md_path = self.output_dir / f"{report_name}.md"
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        with open(md_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines(chunks)
 
         # 保存 JSON 格式（原始数据）
         json_path = self.output_dir / f"{report_name}.json"
         # 这里可以添加更多元数据
         report_data = {
             "report_name": report_name,
-            "timestamp": datetime.now().isoformat(),
-            "content": report_content
+            "timestamp": generated_at.isoformat(),
+            "content": "".join(chunks)
         }
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(json_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                json.dump(report_data, f, ensure_ascii=False, indent=2)
 
         return str(md_path)
 
-    def _get_grade(self, score: float) -> str:
-        """将分数转换为等级（使用 GradeFormatter）"""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_grade(score: float) -> str:
+        """将分数转换为等级（使用 GradeFormatter，结果按分数缓存）"""
         return GradeFormatter.get_grade(score, is_10_scale=True)
 
-    def _get_scenario_recommendation(self, dimension: str) -> str:
-        """获取维度对应的应用场景建议"""
-        scenarios = {
-            "basic_performance": "对实时性要求高的场景，如在线对话、实时响应",
-            "core_capabilities": "需要复杂推理和代码生成的场景，如编程辅助、问题解决",
-            "practical_scenarios": "专业领域的实际应用，如咨询、分析、文档处理",
-            "advanced_features": "需要创新思维和复杂推理的高级应用场景"
-        }
-        return scenarios.get(dimension, "通用场景")
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _get_scenario_recommendation(dimension: str) -> str:
+        """获取维度对应的应用场景建议（结果按维度缓存）"""
+        return MiniMaxReportGenerator._SCENARIO_MAP.get(dimension, "通用场景")
 
     # ========== 扩展可视化图表生成方法 ==========
 
@@ -410,12 +474,17 @@ class MiniMaxReportGenerator(ReportGenerator):
         Returns:
             Dict[str, str]: 图表名称到 HTML 的映射
         """
-        if not PLOTLY_AVAILABLE:
+        if not _load_plotly():
             print("⚠️  Plotly 未安装，无法生成可视化图表")
             return {}
 
         charts = {}
 
+        # 输入为空时跳过对应图表，避免为空数据构建 Figure 并渲染 HTML
+        has_dims = any(dimension_scores.get(m) for m in ("deepseek", "glm"))
+        has_metrics = bool(metrics)
+        has_quality = bool(quality_stats)
+
         # 原有图表（保留）
         # charts["radar"] = self._create_radar_chart(dimension_scores)
         # charts["heatmap"] = self._create_heatmap(dimension_scores)
@@ -423,45 +492,52 @@ class MiniMaxReportGenerator(ReportGenerator):
         # charts["confidence_interval"] = self._create_confidence_interval(dimension_scores)
 
         # 新增图表
-        try:
-            charts["box_plot"] = self._create_box_plot(dimension_scores)
-        except Exception as e:
-            print(f"⚠️  箱型图生成失败: {e}")
-
-        try:
-            charts["violin_plot"] = self._create_violin_plot(dimension_scores)
-        except Exception as e:
-            print(f"⚠️  小提琴图生成失败: {e}")
-
-        try:
-            charts["scatter_performance_quality"] = self._create_scatter_plot(metrics, quality_stats)
-        except Exception as e:
-            print(f"⚠️  散点图生成失败: {e}")
-
-        try:
-            charts["stacked_grade"] = self._create_stacked_grade_distribution(quality_stats)
-        except Exception as e:
-            print(f"⚠️  堆叠柱状图生成失败: {e}")
-
-        try:
-            charts["waterfall"] = self._create_waterfall_chart(dimension_scores)
-        except Exception as e:
-            print(f"⚠️  瀑布图生成失败: {e}")
-
+        if has_dims:
+            try:
+                charts["box_plot"] = self._create_box_plot(dimension_scores)
+            except Exception as e:
+                print(f"⚠️  箱型图生成失败: {e}")
+
+            try:
+                charts["violin_plot"] = self._create_violin_plot(dimension_scores)
+            except Exception as e:
+                print(f"⚠️  小提琴图生成失败: {e}")
+
+        if has_metrics:
+            try:
+                charts["scatter_performance_quality"] = self._create_scatter_plot(metrics, quality_stats)
+            except Exception as e:
+                print(f"⚠️  散点图生成失败: {e}")
+
+        if has_quality:
+            try:
+                charts["stacked_grade"] = self._create_stacked_grade_distribution(quality_stats)
+            except Exception as e:
+                print(f"⚠️  堆叠柱状图生成失败: {e}")
+
+        if has_dims:
+            try:
+                charts["waterfall"] = self._create_waterfall_chart(dimension_scores)
+            except Exception as e:
+                print(f"⚠️  瀑布图生成失败: {e}")
+
+        # 桑基图只展示固定的 Judge 权重，不依赖输入数据
         try:
             charts["sankey"] = self._create_sankey_diagram(quality_stats)
         except Exception as e:
             print(f"⚠️  桑基图生成失败: {e}")
 
-        try:
-            charts["cdf"] = self._create_cdf_chart(metrics)
-        except Exception as e:
-            print(f"⚠️  CDF图生成失败: {e}")
+        if has_metrics:
+            try:
+                charts["cdf"] = self._create_cdf_chart(metrics)
+            except Exception as e:
+                print(f"⚠️  CDF图生成失败: {e}")
 
-        try:
-            charts["area_chart"] = self._create_area_chart(dimension_scores)
-        except Exception as e:
-            print(f"⚠️  面积图生成失败: {e}")
+        if has_dims:
+            try:
+                charts["area_chart"] = self._create_area_chart(dimension_scores)
+            except Exception as e:
+                print(f"⚠️  面积图生成失败: {e}")
 
         return charts
 
@@ -477,29 +553,14 @@ class MiniMaxReportGenerator(ReportGenerator):
 
         fig = go.Figure()
 
-        # DeepSeek 数据
-        for category in categories:
-            dim_key = category_map[category]
-            score = dimension_scores.get("deepseek", {}).get(dim_key, 0)
+        # 每个模型一条 trace，x 为各维度类别（按类别分组成箱）
+        for model, label in (("deepseek", "DeepSeek"), ("glm", "GLM")):
+            model_scores = dimension_scores.get(model, {})
             fig.add_trace(go.Box(
-                x=[category],
-                y=[score],
-                name='DeepSeek',
-                marker_color=get_model_color("deepseek"),
-                boxmean='sd',
-                jitter=0.3,
-                pointpos=-1.8
-            ))
-
-        # GLM 数据
-        for category in categories:
-            dim_key = category_map[category]
-            score = dimension_scores.get("glm", {}).get(dim_key, 0)
-            fig.add_trace(go.Box(
-                x=[category],
-                y=[score],
-                name='GLM',
-                marker_color=get_model_color("glm"),
+                x=categories,
+                y=[model_scores.get(category_map[category], 0) for category in categories],
+                name=label,
+                marker_color=self._color_cache[model],
                 boxmean='sd',
                 jitter=0.3,
                 pointpos=-1.8
@@ -513,7 +574,7 @@ class MiniMaxReportGenerator(ReportGenerator):
             boxmode='group'
         )
 
-        return fig.to_html()
+        return fig.to_html(**_PLOTLY_HTML_OPTIONS)
 
     def _create_violin_plot(self, dimension_scores: Dict[str, Any]) -> str:
         """创建小提琴图"""
@@ -522,30 +583,16 @@ class MiniMaxReportGenerator(ReportGenerator):
 
         fig = go.Figure()
 
-        # DeepSeek 小提琴
-        for i, (dim, dim_key) in enumerate(zip(dimensions, dim_keys)):
-            score = dimension_scores.get("deepseek", {}).get(dim_key, 0)
+        # 每个模型一条 trace，x 为各维度（按维度分组成小提琴）
+        for model, label in (("deepseek", "DeepSeek"), ("glm", "GLM")):
+            model_scores = dimension_scores.get(model, {})
             fig.add_trace(go.Violin(
-                x=[dim],
-                y=[score],
-                name='DeepSeek',
-                line_color=get_model_color("deepseek"),
-                fillcolor=f"{get_model_color('deepseek', 'rgba_medium').replace('0.3', '0.3')}",
-                meanline_visible=True,
-                showlegend=(i == 0)
-            ))
-
-        # GLM 小提琴
-        for i, (dim, dim_key) in enumerate(zip(dimensions, dim_keys)):
-            score = dimension_scores.get("glm", {}).get(dim_key, 0)
-            fig.add_trace(go.Violin(
-                x=[dim],
-                y=[score],
-                name='GLM',
-                line_color=get_model_color("glm"),
-                fillcolor=f"{get_model_color('glm', 'rgba_medium').replace('0.3', '0.3')}",
-                meanline_visible=True,
-                showlegend=(i == 0)
+                x=dimensions,
+                y=[model_scores.get(dim_key, 0) for dim_key in dim_keys],
+                name=label,
+                line_color=self._color_cache[model],
+                fillcolor=self._color_cache[f"{model}_rgba_medium"],
+                meanline_visible=True
             ))
 
         fig.update_layout(
@@ -556,27 +603,21 @@ class MiniMaxReportGenerator(ReportGenerator):
             violinmode='group'
         )
 
-        return fig.to_html()
+        return fig.to_html(**_PLOTLY_HTML_OPTIONS)
 
     def _create_scatter_plot(self, metrics: List[Dict[str, Any]], quality_stats: Dict[str, Any]) -> str:
         """创建性能-质量散点图"""
-        # 提取数据
-        deepseek_ttft = []
-        deepseek_quality = []
-        glm_ttft = []
-        glm_quality = []
-
-        for metric in metrics:
-            for model_name in ["deepseek", "glm"]:
-                ttft = metric.get(model_name, {}).get("avg_ttft", 0) / 1000  # 转换为秒
-                quality = quality_stats.get(model_name, {}).get("overall_score", 0)
-
-                if model_name == "deepseek":
-                    deepseek_ttft.append(ttft)
-                    deepseek_quality.append(quality)
-                else:
-                    glm_ttft.append(ttft)
-                    glm_quality.append(quality)
+        # 提取数据：TTFT 按测试逐条取值（转换为秒），质量得分每个模型只有一个总分
+        def ttft_seconds(model_name: str) -> np.ndarray:
+            return np.fromiter(
+                (m.get(model_name, {}).get("avg_ttft", 0) for m in metrics),
+                dtype=np.float64, count=len(metrics)
+            ) / 1000
+
+        deepseek_ttft = ttft_seconds("deepseek")
+        glm_ttft = ttft_seconds("glm")
+        deepseek_quality = [quality_stats.get("deepseek", {}).get("overall_score", 0)] * len(metrics)
+        glm_quality = [quality_stats.get("glm", {}).get("overall_score", 0)] * len(metrics)
 
         fig = go.Figure()
 
@@ -588,7 +629,7 @@ class MiniMaxReportGenerator(ReportGenerator):
             name='DeepSeek',
             marker=dict(
                 size=12,
-                color=get_model_color("deepseek"),
+                color=self._color_cache["deepseek"],
                 opacity=0.7,
                 line=dict(width=1, color='white')
             ),
@@ -604,7 +645,7 @@ class MiniMaxReportGenerator(ReportGenerator):
             name='GLM',
             marker=dict(
                 size=12,
-                color=get_model_color("glm"),
+                color=self._color_cache["glm"],
                 opacity=0.7,
                 line=dict(width=1, color='white')
             ),
@@ -636,7 +677,7 @@ class MiniMaxReportGenerator(ReportGenerator):
             font=dict(size=12, color="#059669")
         )
 
-        return fig.to_html()
+        return fig.to_html(**_PLOTLY_HTML_OPTIONS)
 
     def _create_stacked_grade_distribution(self, quality_stats: Dict[str, Any]) -> str:
         """创建评分等级堆叠柱状图"""
@@ -679,33 +720,22 @@ class MiniMaxReportGenerator(ReportGenerator):
             xaxis_title="模型"
         )
 
-        return fig.to_html()
+        return fig.to_html(**_PLOTLY_HTML_OPTIONS)
 
     def _create_waterfall_chart(self, dimension_scores: Dict[str, Any]) -> str:
         """创建综合得分瀑布图"""
         dimensions = ["基础性能", "核心能力", "实用场景", "高级特性", "综合得分"]
         dim_keys = ["basic_performance", "core_capabilities", "practical_scenarios", "advanced_features"]
-        weights = [0.25, 0.35, 0.25, 0.15, 0]
-
-        # DeepSeek
-        deepseek_values = []
-        deepseek_total = 0
-        for i, dim_key in enumerate(dim_keys):
-            score = dimension_scores.get("deepseek", {}).get(dim_key, 0)
-            weighted = score * weights[i]
-            deepseek_values.append(weighted)
-            deepseek_total += weighted
-        deepseek_values.append(deepseek_total)
-
-        # GLM
-        glm_values = []
-        glm_total = 0
-        for i, dim_key in enumerate(dim_keys):
-            score = dimension_scores.get("glm", {}).get(dim_key, 0)
-            weighted = score * weights[i]
-            glm_values.append(weighted)
-            glm_total += weighted
-        glm_values.append(glm_total)
+        weights = self._WATERFALL_WEIGHTS
+
+        def weighted_values(model: str) -> List[float]:
+            # 各维度加权得分 + 综合得分（加权和）
+            scores = np.array([dimension_scores.get(model, {}).get(k, 0) for k in dim_keys], dtype=np.float64)
+            weighted = scores * weights
+            return np.append(weighted, weighted.sum()).tolist()
+
+        deepseek_values = weighted_values("deepseek")
+        glm_values = weighted_values("glm")
 
         fig = go.Figure()
 
@@ -715,7 +745,7 @@ class MiniMaxReportGenerator(ReportGenerator):
             y=deepseek_values,
             mode='lines+markers',
             name='DeepSeek',
-            line=dict(color=get_model_color("deepseek"), width=2),
+            line=dict(color=self._color_cache["deepseek"], width=2),
             marker=dict(size=10),
             connectgaps=True
         ))
@@ -726,14 +756,14 @@ class MiniMaxReportGenerator(ReportGenerator):
             y=glm_values,
             mode='lines+markers',
             name='GLM',
-            line=dict(color=get_model_color("glm"), width=2),
+            line=dict(color=self._color_cache["glm"], width=2),
             marker=dict(size=10),
             connectgaps=True
         ))
 
         # 添加权重标注
         annotations = []
-        for i, (dim, weight) in enumerate(zip(dimensions[:-1], weights)):
+        for dim, weight in zip(dimensions[:-1], weights.tolist()):
             annotations.append(dict(
                 x=dim, y=0,
                 text=f"权重 {weight*100:.0f}%",
@@ -750,7 +780,7 @@ class MiniMaxReportGenerator(ReportGenerator):
             hovermode='x unified'
         )
 
-        return fig.to_html()
+        return fig.to_html(**_PLOTLY_HTML_OPTIONS)
 
     def _create_sankey_diagram(self, quality_stats: Dict[str, Any]) -> str:
         """创建评价权重流向桑基图"""
@@ -811,47 +841,33 @@ class MiniMaxReportGenerator(ReportGenerator):
             font=dict(size=12)
         )
 
-        return fig.to_html()
+        return fig.to_html(**_PLOTLY_HTML_OPTIONS)
 
     def _create_cdf_chart(self, metrics: List[Dict[str, Any]]) -> str:
         """创建 TTFT 累积分布函数图"""
-        # 收集 TTFT 数据
-        deepseek_ttft = sorted([
-            m.get("deepseek", {}).get("avg_ttft", 0)
-            for m in metrics if m.get("deepseek", {}).get("avg_ttft", 0) > 0
-        ])
-
-        glm_ttft = sorted([
-            m.get("glm", {}).get("avg_ttft", 0)
-            for m in metrics if m.get("glm", {}).get("avg_ttft", 0) > 0
-        ])
-
-        # 计算 CDF
-        deepseek_cdf = np.arange(1, len(deepseek_ttft) + 1) / len(deepseek_ttft) if deepseek_ttft else []
-        glm_cdf = np.arange(1, len(glm_ttft) + 1) / len(glm_ttft) if glm_ttft else []
+        def ttft_cdf(model: str):
+            # 收集正值 TTFT 并原地排序，CDF 第 i 个点为 (i + 1) / n
+            ttft = np.fromiter(
+                (m.get(model, {}).get("avg_ttft", 0) for m in metrics), dtype=np.float64
+            )
+            ttft = ttft[ttft > 0]
+            ttft.sort()
+            return ttft, np.arange(1, ttft.size + 1) / ttft.size
 
         fig = go.Figure()
 
-        if deepseek_ttft and deepseek_cdf is not None and len(deepseek_cdf) > 0:
-            fig.add_trace(go.Scatter(
-                x=deepseek_ttft,
-                y=deepseek_cdf,
-                mode='lines',
-                name='DeepSeek',
-                line=dict(color=get_model_color("deepseek"), width=3),
-                fill='tozeroy',
-                fillcolor=f"{get_model_color('deepseek', 'rgba_light').replace('0.1', '0.1')}"
-            ))
-
-        if glm_ttft and glm_cdf is not None and len(glm_cdf) > 0:
+        for model, label in (("deepseek", "DeepSeek"), ("glm", "GLM")):
+            ttft, cdf = ttft_cdf(model)
+            if ttft.size == 0:
+                continue
             fig.add_trace(go.Scatter(
-                x=glm_ttft,
-                y=glm_cdf,
+                x=ttft,
+                y=cdf,
                 mode='lines',
-                name='GLM',
-                line=dict(color=get_model_color("glm"), width=3),
+                name=label,
+                line=dict(color=self._color_cache[model], width=3),
                 fill='tozeroy',
-                fillcolor=f"{get_model_color('glm', 'rgba_light').replace('0.1', '0.1')}"
+                fillcolor=self._color_cache[f"{model}_rgba_light"]
             ))
 
         # 添加百分位线
@@ -872,7 +888,7 @@ class MiniMaxReportGenerator(ReportGenerator):
             hovermode='x unified'
         )
 
-        return fig.to_html()
+        return fig.to_html(**_PLOTLY_HTML_OPTIONS)
 
     def _create_area_chart(self, dimension_scores: Dict[str, Any]) -> str:
         """创建多维度面积图"""
@@ -896,9 +912,9 @@ class MiniMaxReportGenerator(ReportGenerator):
             y=deepseek_scores,
             mode='lines+markers',
             name='DeepSeek',
-            line=dict(color=get_model_color("deepseek"), width=2),
+            line=dict(color=self._color_cache["deepseek"], width=2),
             fill='tozeroy',
-            fillcolor=f"{get_model_color('deepseek', 'rgba_medium').replace('0.2', '0.2')}",
+            fillcolor=self._color_cache["deepseek_rgba_medium"],
             stackgroup='one'
         ))
 
@@ -907,9 +923,9 @@ class MiniMaxReportGenerator(ReportGenerator):
             y=glm_scores,
             mode='lines+markers',
             name='GLM',
-            line=dict(color=get_model_color("glm"), width=2),
+            line=dict(color=self._color_cache["glm"], width=2),
             fill='tozeroy',
-            fillcolor=f"{get_model_color('glm', 'rgba_medium').replace('0.2', '0.2')}",
+            fillcolor=self._color_cache["glm_rgba_medium"],
             stackgroup='two'
         ))
 
@@ -921,4 +937,4 @@ class MiniMaxReportGenerator(ReportGenerator):
             hovermode='x unified'
         )
 
-        return fig.to_html()
+        return fig.to_html(**_PLOTLY_HTML_OPTIONS)
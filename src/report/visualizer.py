@@ -2,59 +2,365 @@
 
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
+import plotly.io as pio
 import plotly.express as px
-from typing import Dict, List, Any
+import csv
+from collections import namedtuple
+from importlib import metadata
+from typing import Dict, List, Any, Iterable, Optional, Tuple, Union
 import numpy as np
 
+# 批量导出需要 plotly 的 write_images 与 Kaleido >= 1.0（只读取包元数据，不导入 kaleido）
+try:
+    KALEIDO_BATCH_AVAILABLE = (
+        hasattr(pio, "write_images")
+        and int(metadata.version("kaleido").split(".")[0]) >= 1
+    )
+except (metadata.PackageNotFoundError, ValueError):
+    KALEIDO_BATCH_AVAILABLE = False
+
+# MiniMax 15 个能力子维度（热力图列顺序）及其整数列号
+_SUB_DIMENSIONS = (
+    "实时响应", "吞吐量", "稳定性",
+    "逻辑推理", "代码生成", "文本理解", "创意生成",
+    "专业应用", "中文处理", "长文本", "结构化输出",
+    "复杂推理", "指令遵循", "多模态", "创新思维"
+)
+_SUB_DIM_IDX = {name: i for i, name in enumerate(_SUB_DIMENSIONS)}
+
+# 静态图导出参数（按格式）；未列出的格式不导出
+_STATIC_EXPORT_OPTIONS = {
+    'png': {"width": 1200, "height": 600, "scale": 2},
+    'svg': {},
+    'pdf': {},
+}
+
+# matplotlib 中文字体只需设置一次：每次修改 rcParams 都会使字体查找缓存失效
+_RC_INITIALIZED = False
+
+# 四维度雷达图：维度键（按雷达轴顺序）与对应中文标签
+_DIMENSION_KEYS = ("basic_performance", "core_capabilities", "practical_scenarios", "advanced_features")
+_DIMENSION_LABELS = ["基础性能", "核心能力", "实用场景", "高级特性"]
+
+# 模型配色：按名称关键字匹配，均不匹配时使用默认色
+_MODEL_COLOR_RULES = (
+    ('deepseek', 'rgb(99, 110, 250)'),
+    ('glm', 'rgb(239, 85, 59)'),
+)
+_DEFAULT_MODEL_COLOR = 'rgb(75, 192, 192)'
+
+# 评分等级及分数范围（评分等级分布图使用）
+_GRADES = ("优秀", "良好", "合格", "不合格", "严重缺陷")
+_GRADE_RANGES = ("9.0-10.0", "7.5-8.9", "6.0-7.4", "3.0-5.9", "0-2.9")
+
+# ========== 各图表的静态布局（模块加载时构建一次，update_layout 会复制，可安全复用） ==========
+
+_LAYOUT_TTFT = {
+    "title": 'TTFT (首次响应时间) 对比',
+    "xaxis_title": '测试类别',
+    "yaxis_title": 'TTFT (毫秒)',
+    "barmode": 'group',
+    "height": 600
+}
+
+_LAYOUT_SPEED = {
+    "title": '生成速度对比 (tokens/秒)',
+    "xaxis_title": '测试类别',
+    "yaxis_title": '生成速度',
+    "barmode": 'group',
+    "height": 600
+}
+
+_LAYOUT_QUALITY_RADAR = {
+    "polar": dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 5]
+        )
+    ),
+    "showlegend": True,
+    "title": '质量维度对比',
+    "height": 600
+}
+
+_LAYOUT_LATENCY = {
+    "title": '总响应时间热力图 (毫秒)',
+    "xaxis_title": '测试类别',
+    "yaxis_title": '模型',
+    "height": 500
+}
+
+_LAYOUT_SCATTER = {
+    "title": '性能 vs 质量权衡',
+    "xaxis_title": '生成速度 (tokens/秒)',
+    "yaxis_title": '质量分数',
+    "height": 600
+}
+
+_LAYOUT_DIMENSION_RADAR = {
+    "polar": dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 10],
+            tickvals=[0, 2, 4, 6, 8, 10]
+        )
+    ),
+    "showlegend": True,
+    "title": "四维度能力对比雷达图 (MiniMax 标准)",
+    "height": 600
+}
+
+_LAYOUT_CAPABILITY = {
+    "title": "模型能力热力图 (MiniMax 标准)",
+    "xaxis_title": "能力子维度",
+    "yaxis_title": "模型",
+    "height": 500,
+    "xaxis": dict(tickangle=-45)
+}
+
+_LAYOUT_SCORE_DIST = {
+    "title": "评分等级分布对比 (MiniMax 标准)",
+    "xaxis_title": "评分等级",
+    "yaxis_title": "维度数量",
+    "barmode": 'group',
+    "showlegend": True,
+    "height": 600,
+    "annotations": [
+        dict(x=0.5, y=-0.15, showarrow=False,
+             text=f"范围: {_GRADE_RANGES[0]}",
+             xref="paper", yref="paper"),
+        dict(x=0.5, y=-0.2, showarrow=False,
+             text="|".join(_GRADE_RANGES),
+             xref="paper", yref="paper", font=dict(size=8))
+    ]
+}
+
+_LAYOUT_CONFIDENCE = {
+    "title": "综合得分 95% 置信区间 (MiniMax 标准)",
+    "xaxis_title": "模型",
+    "yaxis_title": "综合得分",
+    "yaxis_range": [0, 10],
+    "showlegend": True,
+    "height": 600
+}
+
+
+# SoA（列式）汇总数据的字段：文本列为 object 数组，数值列为 float32 数组
+_SOA_TEXT_FIELDS = ('model_name', 'category')
+_SOA_NUMERIC_FIELDS = ('ttft_mean', 'speed_mean', 'speed_std', 'total_time_mean')
+_SOA_FIELDS = _SOA_TEXT_FIELDS + _SOA_NUMERIC_FIELDS
+
+# 图表只读使用的汇总记录（仅保留绘图字段）
+SummaryRow = namedtuple('SummaryRow', 'model category ttft_mean speed_mean speed_std total_time_mean')
+
+# 汇总数据：原始字典列表、to_soa / load_summaries_soa 得到的列式数组，
+# 或 normalize_summaries 得到的 SummaryRow 元组
+Summaries = Union[List[Dict[str, Any]], Dict[str, np.ndarray], Tuple[SummaryRow, ...]]
+
+
+def normalize_summaries(raw: Summaries) -> Tuple[SummaryRow, ...]:
+    """
+    将汇总字典列表去重并转换为只读的 SummaryRow 元组
+
+    同一 (模型, 类别) 保留首条记录；数值字段缺失时填 0。列式（SoA）输入按行展开后
+    走同一逻辑。已规范化的元组原样返回，因此多个图表共用同一批数据时只需转换一次。
+
+    Args:
+        raw: 类别汇总数据列表，或列式数组字典
+
+    Returns:
+        Tuple[SummaryRow, ...]: 去重后的汇总记录
+    """
+    if isinstance(raw, tuple) and all(isinstance(row, SummaryRow) for row in raw):
+        return raw
+    if isinstance(raw, dict):
+        raw = [
+            dict(zip(_SOA_FIELDS, values))
+            for values in zip(*(raw[field].tolist() for field in _SOA_FIELDS))
+        ]
+
+    rows: Dict[Tuple[str, str], SummaryRow] = {}
+    for s in raw:
+        key = (s['model_name'], s['category'])
+        if key not in rows:
+            rows[key] = SummaryRow(
+                key[0],
+                key[1],
+                s.get('ttft_mean', 0),
+                s.get('speed_mean', 0),
+                s.get('speed_std', 0),
+                s.get('total_time_mean', 0)
+            )
+    return tuple(rows.values())
+
+
+# 排序后的模型 / 类别元组
+_SortKeys = namedtuple('SortKeys', 'models categories')
+
+
+def build_sort_keys(summaries: Summaries) -> _SortKeys:
+    """一次扫描汇总数据，得到排序后的模型与类别元组（可在多个图表间复用）"""
+    rows = normalize_summaries(summaries)
+    return _SortKeys(
+        tuple(sorted({row.model for row in rows})),
+        tuple(sorted({row.category for row in rows}))
+    )
+
+
+# 汇总索引：(排序后的模型元组, 排序后的类别元组, (模型, 类别) -> 汇总记录)
+SummaryIndex = Tuple[Tuple[str, ...], Tuple[str, ...], Dict[Tuple[str, str], SummaryRow]]
+
 
 class ReportVisualizer:
     """报告可视化生成器"""
 
+    __slots__ = ('_color_cache',)
+
     def __init__(self):
         """初始化可视化生成器"""
-        # 设置中文字体
-        plt.rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS']
-        plt.rcParams['axes.unicode_minus'] = False
+        global _RC_INITIALIZED
+        # 设置中文字体（进程内只设置一次）
+        if not _RC_INITIALIZED:
+            plt.rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS']
+            plt.rcParams['axes.unicode_minus'] = False
+            _RC_INITIALIZED = True
+        # 模型名 -> 颜色（首次出现时计算）
+        self._color_cache: Dict[str, str] = {}
+
+    def _color_for(self, name: str) -> str:
+        """获取模型配色（按模型名缓存，避免每条轨迹重复 lower() 与子串扫描）"""
+        color = self._color_cache.get(name)
+        if color:
+            return color
+        lowered = name.lower()
+        color = next(
+            (c for keyword, c in _MODEL_COLOR_RULES if keyword in lowered),
+            _DEFAULT_MODEL_COLOR
+        )
+        self._color_cache[name] = color
+        return color
+
+    @staticmethod
+    def _index(
+        summaries: Summaries,
+        sort_keys: Optional[_SortKeys] = None
+    ) -> SummaryIndex:
+        """
+        扫描一次汇总数据，构建各图表共用的索引
+
+        同一批 summaries 绘制多张图表时，调用方可先构建索引再通过 index 参数传入，
+        避免每个图表方法重复扫描、排序。
+
+        Args:
+            summaries: 类别汇总数据列表
+            sort_keys: 预先计算的排序键（可选，见 build_sort_keys）
+
+        Returns:
+            SummaryIndex: (模型元组, 类别元组, (模型, 类别) -> 汇总)
+        """
+        rows = normalize_summaries(summaries)
+        models, categories = sort_keys or build_sort_keys(rows)
+        return models, categories, {(row.model, row.category): row for row in rows}
+
+    @staticmethod
+    def to_soa(summaries: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        将汇总数据（字典列表）转换为列式数组（SoA）
+
+        Args:
+            summaries: 类别汇总数据列表
+
+        Returns:
+            Dict[str, np.ndarray]: 字段名 -> 一维数组（数值字段缺失时填 0），可直接传给各汇总图表
+        """
+        n = len(summaries)
+        soa = {
+            field: np.array([s[field] for s in summaries], dtype=object)
+            for field in _SOA_TEXT_FIELDS
+        }
+        for field in _SOA_NUMERIC_FIELDS:
+            soa[field] = np.fromiter(
+                (s.get(field, 0.0) for s in summaries), dtype=np.float32, count=n
+            )
+        return soa
+
+    @classmethod
+    def load_summaries_soa(cls, path: str) -> Dict[str, np.ndarray]:
+        """
+        从 CSV 或 Parquet 文件批量加载汇总数据为列式数组（SoA）
+
+        Parquet 需要安装 pandas 与 pyarrow；CSV 使用标准库解析。
+
+        Args:
+            path: 文件路径（.csv / .parquet）
+
+        Returns:
+            Dict[str, np.ndarray]: 字段名 -> 一维数组，可直接传给各汇总图表
+        """
+        if str(path).endswith('.parquet'):
+            import pandas as pd
+
+            df = pd.read_parquet(path)
+            soa = {
+                field: df[field].to_numpy(dtype=object) for field in _SOA_TEXT_FIELDS
+            }
+            for field in _SOA_NUMERIC_FIELDS:
+                column = df[field] if field in df else np.zeros(len(df))
+                soa[field] = np.asarray(column, dtype=np.float32)
+            return soa
+
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            rows = [
+                {
+                    **{field: row[field] for field in _SOA_TEXT_FIELDS},
+                    **{field: float(row.get(field) or 0.0) for field in _SOA_NUMERIC_FIELDS}
+                }
+                for row in csv.DictReader(f)
+            ]
+        return cls.to_soa(rows)
 
     def create_ttft_boxplot(
         self,
-        summaries: List[Dict[str, Any]],
-        output_path: str = None
+        summaries: Summaries,
+        output_path: str = None,
+        index: Optional[SummaryIndex] = None,
+        sort_keys: Optional[_SortKeys] = None
     ) -> go.Figure:
         """
         创建 TTFT 箱型图
 
         Args:
-            summaries: 类别汇总数据列表
+            summaries: 类别汇总数据列表（或 normalize_summaries 的结果）
             output_path: 输出路径（可选）
+            index: 预先构建的汇总索引（可选，见 _index）
+            sort_keys: 预先计算的排序键（可选，未传 index 时使用，见 build_sort_keys）
 
         Returns:
             Figure: Plotly 图表对象
         """
-        # 按类别组织数据
-        categories = set(s['category'] for s in summaries)
-        models = set(s['model_name'] for s in summaries)
+        # 按类别组织数据（哈希索引代替逐格线性扫描）
+        models, categories, by_key = index or self._index(summaries, sort_keys)
 
         fig = go.Figure()
 
+        # 每个模型一条 Box 轨迹，x/y 为该模型全部有效类别
         for model in models:
+            xs = []
+            ys = []
             for category in categories:
-                model_data = [s for s in summaries if s['model_name'] == model and s['category'] == category]
-                if model_data and model_data[0]['ttft_mean'] > 0:
-                    fig.add_trace(go.Box(
-                        x=[category],
-                        y=[model_data[0]['ttft_mean']],
-                        name=model,
-                        boxmean='sd'
-                    ))
-
-        fig.update_layout(
-            title='TTFT (首次响应时间) 对比',
-            xaxis_title='测试类别',
-            yaxis_title='TTFT (毫秒)',
-            barmode='group',
-            height=600
-        )
+                summary = by_key.get((model, category))
+                if summary and summary.ttft_mean > 0:
+                    xs.append(category)
+                    ys.append(summary.ttft_mean)
+            if xs:
+                fig.add_trace(go.Box(
+                    x=xs,
+                    y=ys,
+                    name=model,
+                    boxmean='sd'
+                ))
+
+        fig.update_layout(**_LAYOUT_TTFT)
 
         if output_path:
             fig.write_html(output_path)
@@ -63,50 +369,41 @@ class ReportVisualizer:
 
     def create_generation_speed_bar(
         self,
-        summaries: List[Dict[str, Any]],
-        output_path: str = None
+        summaries: Summaries,
+        output_path: str = None,
+        index: Optional[SummaryIndex] = None,
+        sort_keys: Optional[_SortKeys] = None
     ) -> go.Figure:
         """
         创建生成速度柱状图
 
         Args:
-            summaries: 类别汇总数据列表
+            summaries: 类别汇总数据列表（或 normalize_summaries 的结果）
             output_path: 输出路径（可选）
+            index: 预先构建的汇总索引（可选，见 _index）
+            sort_keys: 预先计算的排序键（可选，未传 index 时使用，见 build_sort_keys）
 
         Returns:
             Figure: Plotly 图表对象
         """
-        categories = sorted(set(s['category'] for s in summaries))
-        models = sorted(set(s['model_name'] for s in summaries))
+        models, categories, by_key = index or self._index(summaries, sort_keys)
 
         fig = go.Figure()
 
         for model in models:
-            speeds = []
-            for category in categories:
-                model_data = [s for s in summaries if s['model_name'] == model and s['category'] == category]
-                if model_data:
-                    speeds.append(model_data[0]['speed_mean'])
-                else:
-                    speeds.append(0)
+            # 均值与标准差按同一 (模型, 类别) 键取值，与 categories 逐项对齐；缺失类别填 0
+            cells = [by_key.get((model, category)) for category in categories]
+            speeds = np.array([cell.speed_mean if cell else 0 for cell in cells], dtype=np.float64)
+            stds = np.array([cell.speed_std if cell else 0 for cell in cells], dtype=np.float64)
 
             fig.add_trace(go.Bar(
                 x=categories,
                 y=speeds,
                 name=model,
-                error_y=dict(
-                    type='data',
-                    array=[s['speed_std'] for s in summaries if s['model_name'] == model and s['category'] in categories][:len(categories)]
-                ) if any(s['model_name'] == model for s in summaries) else None
+                error_y=dict(type='data', array=stds)
             ))
 
-        fig.update_layout(
-            title='生成速度对比 (tokens/秒)',
-            xaxis_title='测试类别',
-            yaxis_title='生成速度',
-            barmode='group',
-            height=600
-        )
+        fig.update_layout(**_LAYOUT_SPEED)
 
         if output_path:
             fig.write_html(output_path)
@@ -128,28 +425,20 @@ class ReportVisualizer:
         Returns:
             Figure: Plotly 图表对象
         """
-        criteria = list(next(iter(quality_scores.values())).keys())
+        # 以第一个模型的维度顺序为准，其余模型按该顺序显式取值，避免字典顺序不一致导致错位
+        criteria = tuple(next(iter(quality_scores.values()), ()))
 
         fig = go.Figure()
 
         for model, scores in quality_scores.items():
             fig.add_trace(go.Scatterpolar(
-                r=list(scores.values()),
+                r=[scores.get(criterion, 0) for criterion in criteria],
                 theta=criteria,
                 fill='toself',
                 name=model
             ))
 
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 5]
-                )),
-            showlegend=True,
-            title='质量维度对比',
-            height=600
-        )
+        fig.update_layout(**_LAYOUT_QUALITY_RADAR)
 
         if output_path:
             fig.write_html(output_path)
@@ -158,33 +447,35 @@ class ReportVisualizer:
 
     def create_latency_heatmap(
         self,
-        summaries: List[Dict[str, Any]],
-        output_path: str = None
+        summaries: Summaries,
+        output_path: str = None,
+        index: Optional[SummaryIndex] = None,
+        sort_keys: Optional[_SortKeys] = None
     ) -> go.Figure:
         """
         创建延迟热力图
 
         Args:
-            summaries: 类别汇总数据列表
+            summaries: 类别汇总数据列表（或 normalize_summaries 的结果）
             output_path: 输出路径（可选）
+            index: 预先构建的汇总索引（可选，见 _index）
+            sort_keys: 预先计算的排序键（可选，未传 index 时使用，见 build_sort_keys）
 
         Returns:
             Figure: Plotly 图表对象
         """
-        categories = sorted(set(s['category'] for s in summaries))
-        models = sorted(set(s['model_name'] for s in summaries))
-
-        # 创建矩阵
-        z = []
-        for model in models:
-            row = []
-            for category in categories:
-                model_data = [s for s in summaries if s['model_name'] == model and s['category'] == category]
-                if model_data:
-                    row.append(model_data[0]['total_time_mean'])
-                else:
-                    row.append(0)
-            z.append(row)
+        models, categories, by_key = index or self._index(summaries, sort_keys)
+
+        # 创建矩阵（缺失组合填 0；与能力热力图一致使用 float64，保持原始数值）
+        z = np.fromiter(
+            (
+                by_key[(model, category)].total_time_mean if (model, category) in by_key else 0
+                for model in models
+                for category in categories
+            ),
+            dtype=np.float64,
+            count=len(models) * len(categories)
+        ).reshape(len(models), len(categories))
 
         fig = go.Figure(data=go.Heatmap(
             z=z,
@@ -193,12 +484,7 @@ class ReportVisualizer:
             colorscale='Viridis'
         ))
 
-        fig.update_layout(
-            title='总响应时间热力图 (毫秒)',
-            xaxis_title='测试类别',
-            yaxis_title='模型',
-            height=500
-        )
+        fig.update_layout(**_LAYOUT_LATENCY)
 
         if output_path:
             fig.write_html(output_path)
@@ -207,26 +493,35 @@ class ReportVisualizer:
 
     def create_performance_scatter(
         self,
-        summaries: List[Dict[str, Any]],
+        summaries: Summaries,
         quality_scores: Dict[str, float],
-        output_path: str = None
+        output_path: str = None,
+        index: Optional[SummaryIndex] = None,
+        sort_keys: Optional[_SortKeys] = None
     ) -> go.Figure:
         """
         创建性能-质量散点图
 
         Args:
-            summaries: 类别汇总数据列表
+            summaries: 类别汇总数据列表（或 normalize_summaries 的结果）
             quality_scores: 质量分数 {model: score}
             output_path: 输出路径（可选）
+            index: 预先构建的汇总索引（可选，见 _index）
+            sort_keys: 预先计算的排序键（可选，未传 index 时使用，见 build_sort_keys）
 
         Returns:
             Figure: Plotly 图表对象
         """
+        models, categories, by_key = index or self._index(summaries, sort_keys)
+
         fig = go.Figure()
 
-        for model in set(s['model_name'] for s in summaries):
-            model_summaries = [s for s in summaries if s['model_name'] == model]
-            x = [s['speed_mean'] for s in model_summaries]
+        for model in models:
+            x = [
+                by_key[(model, category)].speed_mean
+                for category in categories
+                if (model, category) in by_key
+            ]
             y = [quality_scores.get(model, 0)] * len(x)
 
             fig.add_trace(go.Scatter(
@@ -237,12 +532,7 @@ class ReportVisualizer:
                 marker=dict(size=10)
             ))
 
-        fig.update_layout(
-            title='性能 vs 质量权衡',
-            xaxis_title='生成速度 (tokens/秒)',
-            yaxis_title='质量分数',
-            height=600
-        )
+        fig.update_layout(**_LAYOUT_SCATTER)
 
         if output_path:
             fig.write_html(output_path)
@@ -266,18 +556,15 @@ class ReportVisualizer:
         Returns:
             Figure: Plotly 图表对象
         """
-        dimensions = ["基础性能", "核心能力", "实用场景", "高级特性"]
+        dimensions = _DIMENSION_LABELS
 
         fig = go.Figure()
 
         for model, scores in dimension_scores.items():
-            # 获取各维度分数
-            model_scores = [
-                scores.get("basic_performance", 0),
-                scores.get("core_capabilities", 0),
-                scores.get("practical_scenarios", 0),
-                scores.get("advanced_features", 0)
-            ]
+            # 获取各维度分数（NumPy 数组作为轨迹数据，plotly 按类型化数组整体序列化）
+            model_scores = np.array(
+                [scores.get(key, 0.0) for key in _DIMENSION_KEYS], dtype=np.float32
+            )
 
             fig.add_trace(go.Scatterpolar(
                 r=model_scores,
@@ -287,17 +574,7 @@ class ReportVisualizer:
                 opacity=0.7
             ))
 
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 10],
-                    tickvals=[0, 2, 4, 6, 8, 10]
-                )),
-            showlegend=True,
-            title="四维度能力对比雷达图 (MiniMax 标准)",
-            height=600
-        )
+        fig.update_layout(**_LAYOUT_DIMENSION_RADAR)
 
         if output_path:
             fig.write_html(output_path)
@@ -319,23 +596,27 @@ class ReportVisualizer:
         Returns:
             Figure: Plotly 图表对象
         """
-        # 12 个子维度
-        sub_dimensions = [
-            "实时响应", "吞吐量", "稳定性",
-            "逻辑推理", "代码生成", "文本理解", "创意生成",
-            "专业应用", "中文处理", "长文本", "结构化输出",
-            "复杂推理", "指令遵循", "多模态", "创新思维"
-        ]
+        # 15 个子维度
+        sub_dimensions = list(_SUB_DIMENSIONS)
 
         models = list(sub_dimension_scores.keys())
 
-        # 构建评分矩阵
-        z_values = []
-        for model in models:
-            row = []
-            for sub_dim in sub_dimensions:
-                row.append(sub_dimension_scores[model].get(sub_dim, 0))
-            z_values.append(row)
+        # 将输入打包为整数下标三元组（未知子维度忽略）
+        rows: List[int] = []
+        cols: List[int] = []
+        vals: List[float] = []
+        for i, model in enumerate(models):
+            for sub_dim, score in sub_dimension_scores[model].items():
+                j = _SUB_DIM_IDX.get(sub_dim)
+                if j is not None:
+                    rows.append(i)
+                    cols.append(j)
+                    vals.append(score)
+
+        # 构建评分矩阵（预分配连续数组，缺失子维度填 0；保持 float64，
+        # 使单元格文本按原始分数由 texttemplate 格式化）
+        z_values = np.zeros((len(models), len(sub_dimensions)), dtype=np.float64)
+        z_values[np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)] = vals
 
         fig = go.Figure(data=go.Heatmap(
             z=z_values,
@@ -350,13 +631,7 @@ class ReportVisualizer:
             zmax=10
         ))
 
-        fig.update_layout(
-            title="模型能力热力图 (MiniMax 标准)",
-            xaxis_title="能力子维度",
-            yaxis_title="模型",
-            height=500,
-            xaxis=dict(tickangle=-45)
-        )
+        fig.update_layout(**_LAYOUT_CAPABILITY)
 
         if output_path:
             fig.write_html(output_path)
@@ -378,8 +653,7 @@ class ReportVisualizer:
         Returns:
             Figure: Plotly 图表对象
         """
-        grades = ["优秀", "良好", "合格", "不合格", "严重缺陷"]
-        grade_ranges = ["9.0-10.0", "7.5-8.9", "6.0-7.4", "3.0-5.9", "0-2.9"]
+        grades = list(_GRADES)
 
         fig = go.Figure()
 
@@ -392,34 +666,16 @@ class ReportVisualizer:
                 stats.get("critical_count", 0)
             ]
 
-            # 根据模型选择颜色
-            color = 'rgb(99, 110, 250)' if 'deepseek' in model.lower() else 'rgb(239, 85, 59)'
-
             fig.add_trace(go.Bar(
                 x=grades,
                 y=counts,
                 name=model,
-                marker_color=color,
+                marker_color=self._color_for(model),
                 text=counts,
                 textposition='outside'
             ))
 
-        fig.update_layout(
-            title="评分等级分布对比 (MiniMax 标准)",
-            xaxis_title="评分等级",
-            yaxis_title="维度数量",
-            barmode='group',
-            showlegend=True,
-            height=600,
-            annotations=[
-                dict(x=0.5, y=-0.15, showarrow=False,
-                     text=f"范围: {grade_ranges[0]}",
-                     xref="paper", yref="paper"),
-                dict(x=0.5, y=-0.2, showarrow=False,
-                     text="|".join(grade_ranges),
-                     xref="paper", yref="paper", font=dict(size=8))
-            ]
-        )
+        fig.update_layout(**_LAYOUT_SCORE_DIST)
 
         if output_path:
             fig.write_html(output_path)
@@ -443,51 +699,43 @@ class ReportVisualizer:
         """
         models = list(statistics.keys())
 
-        mean_scores = [statistics[m]["mean_score"] for m in models]
-        ci_lower = [statistics[m].get("ci_lower", m - 1) for m in models]
-        ci_upper = [statistics[m].get("ci_upper", m + 1) for m in models]
+        stats = [statistics[m] for m in models]
+        n = len(stats)
 
-        # 计算误差范围
-        error_plus = [upper - mean for mean, upper in zip(mean_scores, ci_upper)]
-        error_minus = [mean - lower for mean, lower in zip(mean_scores, ci_lower)]
+        # 缺少置信区间时以均值 ±1 作为默认区间
+        mean_scores = np.fromiter((st["mean_score"] for st in stats), dtype=np.float64, count=n)
+        ci_lower = np.fromiter(
+            (st.get("ci_lower", st["mean_score"] - 1) for st in stats), dtype=np.float64, count=n
+        )
+        ci_upper = np.fromiter(
+            (st.get("ci_upper", st["mean_score"] + 1) for st in stats), dtype=np.float64, count=n
+        )
 
-        # 根据模型选择颜色
-        colors = []
-        for model in models:
-            if 'deepseek' in model.lower():
-                colors.append('rgb(99, 110, 250)')
-            elif 'glm' in model.lower():
-                colors.append('rgb(239, 85, 59)')
-            else:
-                colors.append('rgb(75, 192, 192)')
+        # 计算误差范围（向量化）
+        error_plus = ci_upper - mean_scores
+        error_minus = mean_scores - ci_lower
 
         fig = go.Figure()
 
+        # 每个模型一条轨迹，图例逐模型显示
         for i, model in enumerate(models):
             fig.add_trace(go.Scatter(
                 x=[model],
-                y=[mean_scores[i]],
+                y=[float(mean_scores[i])],
                 error_y=dict(
                     type='data',
                     symmetric=False,
-                    array=[error_plus[i]],
-                    arrayminus=[error_minus[i]]
+                    array=[float(error_plus[i])],
+                    arrayminus=[float(error_minus[i])]
                 ),
                 mode='markers',
                 name=model,
-                marker=dict(size=15, color=colors[i]),
+                marker=dict(size=15, color=self._color_for(model)),
                 text=[f"{mean_scores[i]:.2f}"],
                 textposition='top center'
             ))
 
-        fig.update_layout(
-            title="综合得分 95% 置信区间 (MiniMax 标准)",
-            xaxis_title="模型",
-            yaxis_title="综合得分",
-            yaxis_range=[0, 10],
-            showlegend=True,
-            height=600
-        )
+        fig.update_layout(**_LAYOUT_CONFIDENCE)
 
         if output_path:
             fig.write_html(output_path)
@@ -498,14 +746,39 @@ class ReportVisualizer:
         """
         创建静态图表
 
+        每次调用都要经过一次 Kaleido 渲染往返；导出多张图表时请使用 batch_export。
+
         Args:
             fig: Plotly 图表
             output_path: 输出路径
             format: 格式 ('png', 'svg', 'pdf')
         """
-        if format == 'png':
-            fig.write_image(output_path, format='png', width=1200, height=600, scale=2)
-        elif format == 'svg':
-            fig.write_image(output_path, format='svg')
-        elif format == 'pdf':
-            fig.write_image(output_path, format='pdf')
+        self.batch_export([(fig, output_path)], format)
+
+    def batch_export(self, pairs: Iterable[Tuple[go.Figure, str]], format: str = 'png'):
+        """
+        批量导出静态图表
+
+        Kaleido >= 1.0 且 plotly 提供 write_images 时，所有图表在同一个渲染进程中导出，
+        只付一次启动开销；旧版本退化为逐张 write_image。
+
+        Args:
+            pairs: (图表, 输出路径) 序列
+            format: 格式 ('png', 'svg', 'pdf')
+        """
+        options = _STATIC_EXPORT_OPTIONS.get(format)
+        if options is None:
+            return
+
+        pairs = list(pairs)
+        if not pairs:
+            return
+
+        figs = [fig for fig, _ in pairs]
+        paths = [path for _, path in pairs]
+
+        if KALEIDO_BATCH_AVAILABLE:
+            pio.write_images(figs, paths, format=format, **options)
+        else:
+            for fig, path in zip(figs, paths):
+                fig.write_image(path, format=format, **options)
@@ -1,7 +1,7 @@
 """测试用例注册表基类"""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import Callable, Iterable, List, Dict
 from collections import Counter
 from .base_test import TestCase
 
@@ -9,9 +9,31 @@ from .base_test import TestCase
 class BaseTestRegistry(ABC):
     """测试用例注册表抽象基类，提供通用功能"""
 
+    __slots__ = ('_store', '_providers')
+
     def __init__(self):
         """初始化注册表"""
-        self._tests: Dict[str, TestCase] = {}
+        self._store: Dict[str, TestCase] = {}
+        # 延迟提供者：注册时只保存可调用对象，首次访问用例时才按注册顺序取出
+        self._providers: List[Callable[[], Iterable[TestCase]]] = []
+
+    @property
+    def _tests(self) -> Dict[str, TestCase]:
+        """用例字典（只读访问入口，访问前先合入尚未展开的延迟提供者）"""
+        return self._drain_providers()
+
+    def _drain_providers(self) -> Dict[str, TestCase]:
+        """
+        内部方法：按注册顺序展开延迟提供者，合入自身存储
+
+        Returns:
+            Dict[str, TestCase]: 自身存储的用例字典
+        """
+        if self._providers:
+            providers, self._providers = self._providers, []
+            for provider in providers:
+                self._store.update({tc.name: tc for tc in provider()})
+        return self._store
 
     @abstractmethod
     def register(self, test_case):
@@ -61,9 +83,11 @@ class BaseTestRegistry(ABC):
         Returns:
             Dict[str, int]: 统计信息
         """
+        # _tests 以用例名称为键，名称天然唯一，无需再构建集合去重
+        total = len(self._tests)
         return {
-            "total_tests": len(self._tests),
-            "unique_names": len(set(tc.name for tc in self._tests.values()))
+            "total_tests": total,
+            "unique_names": total
         }
 
     def _register_test(self, test_case: TestCase):
@@ -73,4 +97,22 @@ class BaseTestRegistry(ABC):
         Args:
             test_case: 测试用例对象
         """
-        self._tests[test_case.name] = test_case
+        self._drain_providers()[test_case.name] = test_case
+
+    def _register_bulk(self, test_cases: Iterable[TestCase]):
+        """
+        内部方法：批量注册测试用例（先物化为字典，再一次 update 合入，减少逐条插入引起的扩容）
+
+        Args:
+            test_cases: 测试用例序列
+        """
+        self._drain_providers().update({tc.name: tc for tc in test_cases})
+
+    def _register_provider(self, provider: Callable[[], Iterable[TestCase]]):
+        """
+        内部方法：登记延迟提供者，用例在首次访问注册表时才被迭代合入
+
+        Args:
+            provider: 无参可调用对象，返回测试用例可迭代对象（如生成器函数）
+        """
+        self._providers.append(provider)
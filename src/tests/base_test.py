@@ -1,12 +1,19 @@
 """测试用例基类和数据结构"""
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+import hashlib
+import sys
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import Dict, Iterator, List, Any, Mapping, Optional, Sequence
 
 
-@dataclass
+# TestCase 构造时做 sys.intern 的字符串字段
+_INTERNED_FIELDS = ("minimax_id", "category", "dimension", "sub_dimension", "priority")
+
+
+@dataclass(frozen=True)
 class TestCase:
-    """测试用例数据结构"""
+    """测试用例数据结构（不可变；修改字段请使用 dataclasses.replace）"""
 
     # ========== 保留原有字段（向后兼容） ==========
     name: str  # 测试用例唯一标识符
@@ -15,7 +22,7 @@ class TestCase:
     prompt: str  # 发送给模型的提示词
     parameters: Dict[str, Any] = field(default_factory=dict)  # 模型参数
     expected_tokens_range: Optional[tuple] = None  # 预期 token 范围 (min, max)
-    evaluation_criteria: List[str] = field(default_factory=list)  # 评估标准
+    evaluation_criteria: Sequence[str] = field(default_factory=list)  # 评估标准
     metadata: Dict[str, Any] = field(default_factory=dict)  # 元数据
 
     # ========== 新增 MiniMax 标准字段（Optional） ==========
@@ -24,10 +31,32 @@ class TestCase:
     dimension_weight: Optional[float] = None  # 维度权重
     test_weight: Optional[float] = None  # 测试用例权重
     score_range: Optional[tuple] = None  # 评分范围 (0, 10)
-    quality_criteria: Optional[Dict[str, float]] = None  # 质量标准权重
+    quality_criteria: Optional[Mapping[str, float]] = None  # 质量标准权重
     minimax_id: Optional[str] = None  # MiniMax 用例 ID (如 "A1-001")
     expected_score_range: Optional[tuple] = None  # 预期得分范围
 
+    def __post_init__(self):
+        """驻留分组/索引常用的字符串字段"""
+        # 分组/索引常用的字段驻留为同一字符串对象，字典查找与比较可走指针快速路径
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, sys.intern(value))
+
+    @cached_property
+    def cache_key(self) -> bytes:
+        """
+        提示词 + 模型参数的 SHA-256 摘要（首次访问时计算并缓存）
+
+        用作响应缓存键前缀：模型/供应商由调用方在此摘要之后追加，无需重新哈希提示词。
+
+        Returns:
+            bytes: 32 字节摘要
+        """
+        digest = hashlib.sha256(self.prompt.encode("utf-8"))
+        digest.update(repr(sorted(self.parameters.items())).encode("utf-8"))
+        return digest.digest()
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
         return {
@@ -50,6 +79,8 @@ class TestCase:
 class BaseTestCategory:
     """测试类别基类"""
 
+    __slots__ = ('category_name', 'test_cases')
+
     def __init__(self, category_name: str):
         """
         初始化测试类别
@@ -69,15 +100,29 @@ class BaseTestCategory:
         """
         return self.test_cases
 
-    def add_test_case(self, test_case: TestCase):
+    def iter_test_cases(self) -> Iterator[TestCase]:
+        """
+        逐个产出该类别的测试用例（供注册表按需迭代）
+
+        Yields:
+            TestCase: 测试用例
+        """
+        yield from self.test_cases
+
+    def add_test_case(self, test_case: TestCase) -> TestCase:
         """
         添加测试用例
 
         Args:
             test_case: 测试用例
+
+        Returns:
+            TestCase: 实际加入的测试用例（类别与本类别不一致时为替换后的新实例）
         """
-        test_case.category = self.category_name
+        if test_case.category != self.category_name:
+            test_case = replace(test_case, category=self.category_name)
         self.test_cases.append(test_case)
+        return test_case
 
     def create_test_case(
         self,
@@ -87,7 +132,7 @@ class BaseTestCategory:
         max_tokens: int = 500,
         temperature: float = 0.7,
         expected_tokens_range: Optional[tuple] = None,
-        evaluation_criteria: Optional[List[str]] = None,
+        evaluation_criteria: Optional[Sequence[str]] = None,
         metadata: Optional[Dict[str, Any]] = None
     ) -> TestCase:
         """
@@ -106,7 +151,7 @@ class BaseTestCategory:
         Returns:
             TestCase: 创建的测试用例
         """
-        test_case = TestCase(
+        return self.add_test_case(TestCase(
             name=name,
             category=self.category_name,
             priority=priority,
@@ -118,7 +163,4 @@ class BaseTestCategory:
             expected_tokens_range=expected_tokens_range,
             evaluation_criteria=evaluation_criteria or [],
             metadata=metadata or {}
-        )
-
-        self.add_test_case(test_case)
-        return test_case
+        ))
@@ -7,11 +7,19 @@
 - advanced_features: 高级特性测试 (15个)
 """
 
-# 导入所有测试类别（触发注册到 minimax_registry）
-from .basic_performance import BasicPerformanceTests
-from .core_capabilities import CoreCapabilitiesTests
-from .practical_scenarios import PracticalScenariosTests
-from .advanced_features import AdvancedFeaturesTests
+import importlib
+
+from ..test_registry import registry
+
+# 测试类别按需加载（PEP 562）：首次访问某个类别时才导入其模块；
+# 注册与访问了哪些类别无关——首次查询全局 registry（或其 MiniMax 视图 minimax_registry）时
+# 按固定顺序导入并注册全部类别，导入本包即可得到完整的注册表
+_LAZY = {
+    "BasicPerformanceTests": ".basic_performance",
+    "CoreCapabilitiesTests": ".core_capabilities",
+    "PracticalScenariosTests": ".practical_scenarios",
+    "AdvancedFeaturesTests": ".advanced_features",
+}
 
 __all__ = [
     "BasicPerformanceTests",
@@ -19,3 +27,22 @@ __all__ = [
     "PracticalScenariosTests",
     "AdvancedFeaturesTests",
 ]
+
+
+def _register_all():
+    """导入全部类别模块并依次注册到全局 registry（由 registry 在首次查询时调用一次）"""
+    for module_name in _LAZY.values():
+        importlib.import_module(module_name, __name__).register()
+
+
+registry.add_category_loader(_register_all)
+
+
+def __getattr__(name):
+    """首次访问测试类别时导入对应模块，结果缓存到模块命名空间"""
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,318 +7,218 @@
 - D4: 创新思维能力测试 (2个)
 """
 
+from types import MappingProxyType
+
 from ..base_test import BaseTestCategory, TestCase
-from ..minimax_registry import minimax_registry
+from ..test_registry import registry
+
+
+# 重复出现的字面量提升为模块级常量，各用例共享同一对象
+_CATEGORY = "advanced_features"
+_SCORE_RANGE = (0, 10)
+_EXPECTED_SCORE_RANGE = (7.5, 9.5)
+
+# 评估标准（元组：下游只读取，不修改）
+_LOGIC_CHAIN_CRITERIA = ("reasoning_quality", "logic_chain", "accuracy")
+
+# 质量标准权重（只读映射，相同权重的用例共享同一实例）
+_QUALITY_BALANCED = MappingProxyType({"accuracy": 0.35, "completeness": 0.35, "logic": 0.30})
+_QUALITY_ACCURACY_40 = MappingProxyType({"accuracy": 0.40, "completeness": 0.35, "logic": 0.25})
+_QUALITY_ACCURACY_45 = MappingProxyType({"accuracy": 0.45, "completeness": 0.35, "logic": 0.20})
+_QUALITY_ACCURACY_50 = MappingProxyType({"accuracy": 0.50, "completeness": 0.30, "logic": 0.20})
+_QUALITY_CREATIVITY_50 = MappingProxyType({"creativity": 0.50, "completeness": 0.30, "logic": 0.20})
+_QUALITY_ACCURACY_40_40 = MappingProxyType({"accuracy": 0.40, "completeness": 0.40, "logic": 0.20})
+_QUALITY_CREATIVITY_40 = MappingProxyType({"creativity": 0.40, "completeness": 0.35, "logic": 0.25})
+_QUALITY_CREATIVITY_45 = MappingProxyType({"creativity": 0.45, "completeness": 0.30, "logic": 0.25})
+
+# 本类别所有用例共享的字段
+_DEFAULTS = {
+    "category": _CATEGORY,
+    "dimension": _CATEGORY,
+    "dimension_weight": 0.15,
+    "score_range": _SCORE_RANGE,
+    "expected_score_range": _EXPECTED_SCORE_RANGE,
+}
+
+# 用例数据：按子维度分组，(子维度, 优先级, 用例类型, 用例行)；
+# 每行只记录变化的字段：(名称, MiniMax ID, 用例权重, 提示词, 模型参数, 预期 token 范围,
+# 评估标准, 质量标准权重, 难度)
+_SECTIONS = (
+    # ========== D1. 复杂推理链测试 (6个) ==========
+    ("复杂推理链", "primary", "complex_reasoning", (
+        (
+            "D1_001_multi_step_reasoning", "D1-001", 0.20,
+            "A、B、C三人中一人说谎。A说B在说谎，B说C在说谎，C说A和B都在说谎。请推理出谁在说谎？",
+            {"max_tokens": 600, "temperature": 0.0}, (400, 600),
+            _LOGIC_CHAIN_CRITERIA,
+            _QUALITY_ACCURACY_45,
+            "hard"
+        ),
+        (
+            "D1_002_conditional_reasoning_chain", "D1-002", 0.18,
+            "如果下雨，运动会取消。如果运动会取消，学生会失望。如果学生失望，家长会投诉。现在下雨了，请推理最终结果",
+            {"max_tokens": 500, "temperature": 0.0}, (300, 500),
+            _LOGIC_CHAIN_CRITERIA,
+            _QUALITY_ACCURACY_45,
+            "medium"
+        ),
+        (
+            "D1_003_inductive_deductive", "D1-003", 0.16,
+            "观察现象：铁能导电、铜能导电、铝能导电。请问所有金属都能导电吗？请进行推理",
+            {"max_tokens": 500, "temperature": 0.0}, (300, 500),
+            _LOGIC_CHAIN_CRITERIA,
+            _QUALITY_ACCURACY_45,
+            "medium"
+        ),
+        (
+            "D1_004_analogy_chain", "D1-004", 0.15,
+            "医生治病如同教师育人，如同工程师建造，如同...请完成这个类比链条并解释",
+            {"max_tokens": 500, "temperature": 0.7}, (300, 500),
+            ("reasoning_quality", "creativity", "accuracy"),
+            _QUALITY_BALANCED,
+            "medium"
+        ),
+        (
+            "D1_005_counterfactual_reasoning", "D1-005", 0.16,
+            "如果清朝没有闭关锁国，中国近代史会有什么不同？请进行反事实推理",
+            {"max_tokens": 700, "temperature": 0.8}, (500, 700),
+            ("reasoning_quality", "historical_knowledge", "creativity"),
+            _QUALITY_BALANCED,
+            "hard"
+        ),
+        (
+            "D1_006_probability_chain", "D1-006", 0.15,
+            "一个家庭有2个孩子，已知至少一个是男孩，求另一个也是男孩的概率",
+            {"max_tokens": 500, "temperature": 0.0}, (300, 500),
+            ("reasoning_quality", "math_accuracy", "logic_chain"),
+            _QUALITY_ACCURACY_50,
+            "hard"
+        ),
+    )),
+
+    # ========== D2. 指令遵循能力测试 (4个) ==========
+    ("指令遵循能力", "primary", "instruction_following", (
+        (
+            "D2_001_strict_instruction", "D2-001", 0.30,
+            "请仅用3句话回答：什么是人工智能？每句话不超过20个字",
+            {"max_tokens": 100, "temperature": 0.7}, (50, 100),
+            ("instruction_following", "constraint_compliance", "accuracy"),
+            _QUALITY_ACCURACY_50,
+            "easy"
+        ),
+        (
+            "D2_002_complex_instruction", "D2-002", 0.25,
+            "先分析一下机器学习的基本概念，然后用Python写一个简单示例，最后解释运行结果",
+            {"max_tokens": 800, "temperature": 0.7}, (500, 800),
+            ("instruction_following", "completeness", "accuracy"),
+            _QUALITY_ACCURACY_40_40,
+            "medium"
+        ),
+        (
+            "D2_003_instruction_correction", "D2-003", 0.25,
+            "先解释量子计算，然后修正为用通俗语言解释，最后给一个生活化的比喻",
+            {"max_tokens": 700, "temperature": 0.7}, (400, 700),
+            ("instruction_following", "adaptability", "clarity"),
+            _QUALITY_ACCURACY_40,
+            "medium"
+        ),
+        (
+            "D2_004_creative_instruction", "D2-004", 0.20,
+            "请用诗歌的形式解释相对论，要押韵且朗朗上口",
+            {"max_tokens": 400, "temperature": 0.8}, (250, 400),
+            ("instruction_following", "creativity", "accuracy"),
+            _QUALITY_CREATIVITY_40,
+            "hard"
+        ),
+    )),
+
+    # ========== D3. 多模态理解测试 (3个) ==========
+    ("多模态理解", "secondary", "multimodal", (
+        (
+            "D3_001_chart_understanding", "D3-001", 0.40,
+            "请描述这张图表显示的数据趋势并分析可能的原因：[图表描述：这是一张折线图，显示了2020-2024年某公司收入变化情况]",
+            {"max_tokens": 500, "temperature": 0.7}, (300, 500),
+            ("visual_understanding", "data_analysis", "reasoning"),
+            _QUALITY_ACCURACY_45,
+            "medium"
+        ),
+        (
+            "D3_002_visual_analysis", "D3-002", 0.35,
+            "分析这张产品图片的设计风格、目标用户和使用场景：[图片描述：这是一款智能手表的产品图]",
+            {"max_tokens": 500, "temperature": 0.7}, (300, 500),
+            ("visual_understanding", "design_insight", "market_analysis"),
+            _QUALITY_ACCURACY_40,
+            "medium"
+        ),
+        (
+            "D3_003_cross_modal_creation", "D3-003", 0.25,
+            "根据这张风景照片，创作一首相关的诗歌：[照片描述：这是一张夕阳下的海滩照片]",
+            {"max_tokens": 400, "temperature": 0.8}, (250, 400),
+            ("visual_understanding", "creativity", "emotional_depth"),
+            _QUALITY_CREATIVITY_45,
+            "hard"
+        ),
+    )),
+
+    # ========== D4. 创新思维能力测试 (2个) ==========
+    ("创新思维能力", "primary", "innovative_thinking", (
+        (
+            "D4_001_conceptual_innovation", "D4-001", 0.50,
+            "如何重新定义'教育'概念以适应AI时代？提出创新观点",
+            {"max_tokens": 700, "temperature": 0.9}, (500, 700),
+            ("innovation", "feasibility", "depth"),
+            _QUALITY_CREATIVITY_50,
+            "hard"
+        ),
+        (
+            "D4_002_solution_innovation", "D4-002", 0.50,
+            "传统交通方式面临哪些根本性挑战？提出颠覆性解决方案",
+            {"max_tokens": 800, "temperature": 0.9}, (600, 800),
+            ("innovation", "feasibility", "impact"),
+            _QUALITY_CREATIVITY_50,
+            "hard"
+        ),
+    )),
+)
+
+# 测试用例定义：模块导入时由 _SECTIONS 构建一次（TestCase 不可变，可在多个实例间共享）
+_SPECS = tuple(
+    TestCase(
+        name=name,
+        priority=priority,
+        prompt=prompt,
+        parameters=parameters,
+        expected_tokens_range=expected_tokens_range,
+        evaluation_criteria=evaluation_criteria,
+        metadata={"type": case_type, "difficulty": difficulty},
+        sub_dimension=sub_dimension,
+        test_weight=test_weight,
+        quality_criteria=quality_criteria,
+        minimax_id=minimax_id,
+        **_DEFAULTS
+    )
+    for sub_dimension, priority, case_type, rows in _SECTIONS
+    for (
+        name, minimax_id, test_weight, prompt, parameters, expected_tokens_range,
+        evaluation_criteria, quality_criteria, difficulty
+    ) in rows
+)
 
 
 class AdvancedFeaturesTests(BaseTestCategory):
     """高级特性测试（15个用例）"""
 
+    __slots__ = ()
+
     def __init__(self):
-        super().__init__("advanced_features")
+        super().__init__(_CATEGORY)
         self._create_tests()
 
     def _create_tests(self):
-        """创建高级特性测试用例"""
-
-        # ========== D1. 复杂推理链测试 (6个) ==========
-
-        self.add_test_case(TestCase(
-            name="D1_001_multi_step_reasoning",
-            category="advanced_features",
-            priority="primary",
-            prompt="A、B、C三人中一人说谎。A说B在说谎，B说C在说谎，C说A和B都在说谎。请推理出谁在说谎？",
-            parameters={"max_tokens": 600, "temperature": 0.0},
-            expected_tokens_range=(400, 600),
-            evaluation_criteria=["reasoning_quality", "logic_chain", "accuracy"],
-            metadata={"type": "complex_reasoning", "difficulty": "hard"},
-            dimension="advanced_features",
-            sub_dimension="复杂推理链",
-            dimension_weight=0.15,
-            test_weight=0.20,
-            score_range=(0, 10),
-            quality_criteria={"accuracy": 0.45, "completeness": 0.35, "logic": 0.20},
-            minimax_id="D1-001",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        self.add_test_case(TestCase(
-            name="D1_002_conditional_reasoning_chain",
-            category="advanced_features",
-            priority="primary",
-            prompt="如果下雨，运动会取消。如果运动会取消，学生会失望。如果学生失望，家长会投诉。现在下雨了，请推理最终结果",
-            parameters={"max_tokens": 500, "temperature": 0.0},
-            expected_tokens_range=(300, 500),
-            evaluation_criteria=["reasoning_quality", "logic_chain", "accuracy"],
-            metadata={"type": "complex_reasoning", "difficulty": "medium"},
-            dimension="advanced_features",
-            sub_dimension="复杂推理链",
-            dimension_weight=0.15,
-            test_weight=0.18,
-            score_range=(0, 10),
-            quality_criteria={"accuracy": 0.45, "completeness": 0.35, "logic": 0.20},
-            minimax_id="D1-002",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        self.add_test_case(TestCase(
-            name="D1_003_inductive_deductive",
-            category="advanced_features",
-            priority="primary",
-            prompt="观察现象：铁能导电、铜能导电、铝能导电。请问所有金属都能导电吗？请进行推理",
-            parameters={"max_tokens": 500, "temperature": 0.0},
-            expected_tokens_range=(300, 500),
-            evaluation_criteria=["reasoning_quality", "logic_chain", "accuracy"],
-            metadata={"type": "complex_reasoning", "difficulty": "medium"},
-            dimension="advanced_features",
-            sub_dimension="复杂推理链",
-            dimension_weight=0.15,
-            test_weight=0.16,
-            score_range=(0, 10),
-            quality_criteria={"accuracy": 0.45, "completeness": 0.35, "logic": 0.20},
-            minimax_id="D1-003",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        self.add_test_case(TestCase(
-            name="D1_004_analogy_chain",
-            category="advanced_features",
-            priority="primary",
-            prompt="医生治病如同教师育人，如同工程师建造，如同...请完成这个类比链条并解释",
-            parameters={"max_tokens": 500, "temperature": 0.7},
-            expected_tokens_range=(300, 500),
-            evaluation_criteria=["reasoning_quality", "creativity", "accuracy"],
-            metadata={"type": "complex_reasoning", "difficulty": "medium"},
-            dimension="advanced_features",
-            sub_dimension="复杂推理链",
-            dimension_weight=0.15,
-            test_weight=0.15,
-            score_range=(0, 10),
-            quality_criteria={"accuracy": 0.35, "completeness": 0.35, "logic": 0.30},
-            minimax_id="D1-004",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        self.add_test_case(TestCase(
-            name="D1_005_counterfactual_reasoning",
-            category="advanced_features",
-            priority="primary",
-            prompt="如果清朝没有闭关锁国，中国近代史会有什么不同？请进行反事实推理",
-            parameters={"max_tokens": 700, "temperature": 0.8},
-            expected_tokens_range=(500, 700),
-            evaluation_criteria=["reasoning_quality", "historical_knowledge", "creativity"],
-            metadata={"type": "complex_reasoning", "difficulty": "hard"},
-            dimension="advanced_features",
-            sub_dimension="复杂推理链",
-            dimension_weight=0.15,
-            test_weight=0.16,
-            score_range=(0, 10),
-            quality_criteria={"accuracy": 0.35, "completeness": 0.35, "logic": 0.30},
-            minimax_id="D1-005",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        self.add_test_case(TestCase(
-            name="D1_006_probability_chain",
-            category="advanced_features",
-            priority="primary",
-            prompt="一个家庭有2个孩子，已知至少一个是男孩，求另一个也是男孩的概率",
-            parameters={"max_tokens": 500, "temperature": 0.0},
-            expected_tokens_range=(300, 500),
-            evaluation_criteria=["reasoning_quality", "math_accuracy", "logic_chain"],
-            metadata={"type": "complex_reasoning", "difficulty": "hard"},
-            dimension="advanced_features",
-            sub_dimension="复杂推理链",
-            dimension_weight=0.15,
-            test_weight=0.15,
-            score_range=(0, 10),
-            quality_criteria={"accuracy": 0.50, "completeness": 0.30, "logic": 0.20},
-            minimax_id="D1-006",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        # ========== D2. 指令遵循能力测试 (4个) ==========
+        """创建高级特性测试用例（共享模块级 _SPECS，类别均为 advanced_features，直接追加）"""
+        self.test_cases.extend(_SPECS)
 
-        self.add_test_case(TestCase(
-            name="D2_001_strict_instruction",
-            category="advanced_features",
-            priority="primary",
-            prompt="请仅用3句话回答：什么是人工智能？每句话不超过20个字",
-            parameters={"max_tokens": 100, "temperature": 0.7},
-            expected_tokens_range=(50, 100),
-            evaluation_criteria=["instruction_following", "constraint_compliance", "accuracy"],
-            metadata={"type": "instruction_following", "difficulty": "easy"},
-            dimension="advanced_features",
-            sub_dimension="指令遵循能力",
-            dimension_weight=0.15,
-            test_weight=0.30,
-            score_range=(0, 10),
-            quality_criteria={"accuracy": 0.50, "completeness": 0.30, "logic": 0.20},
-            minimax_id="D2-001",
-            expected_score_range=(7.5, 9.5)
-        ))
 
-        self.add_test_case(TestCase(
-            name="D2_002_complex_instruction",
-            category="advanced_features",
-            priority="primary",
-            prompt="先分析一下机器学习的基本概念，然后用Python写一个简单示例，最后解释运行结果",
-            parameters={"max_tokens": 800, "temperature": 0.7},
-            expected_tokens_range=(500, 800),
-            evaluation_criteria=["instruction_following", "completeness", "accuracy"],
-            metadata={"type": "instruction_following", "difficulty": "medium"},
-            dimension="advanced_features",
-            sub_dimension="指令遵循能力",
-            dimension_weight=0.15,
-            test_weight=0.25,
-            score_range=(0, 10),
-            quality_criteria={"accuracy": 0.40, "completeness": 0.40, "logic": 0.20},
-            minimax_id="D2-002",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        self.add_test_case(TestCase(
-            name="D2_003_instruction_correction",
-            category="advanced_features",
-            priority="primary",
-            prompt="先解释量子计算，然后修正为用通俗语言解释，最后给一个生活化的比喻",
-            parameters={"max_tokens": 700, "temperature": 0.7},
-            expected_tokens_range=(400, 700),
-            evaluation_criteria=["instruction_following", "adaptability", "clarity"],
-            metadata={"type": "instruction_following", "difficulty": "medium"},
-            dimension="advanced_features",
-            sub_dimension="指令遵循能力",
-            dimension_weight=0.15,
-            test_weight=0.25,
-            score_range=(0, 10),
-            quality_criteria={"accuracy": 0.40, "completeness": 0.35, "logic": 0.25},
-            minimax_id="D2-003",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        self.add_test_case(TestCase(
-            name="D2_004_creative_instruction",
-            category="advanced_features",
-            priority="primary",
-            prompt="请用诗歌的形式解释相对论，要押韵且朗朗上口",
-            parameters={"max_tokens": 400, "temperature": 0.8},
-            expected_tokens_range=(250, 400),
-            evaluation_criteria=["instruction_following", "creativity", "accuracy"],
-            metadata={"type": "instruction_following", "difficulty": "hard"},
-            dimension="advanced_features",
-            sub_dimension="指令遵循能力",
-            dimension_weight=0.15,
-            test_weight=0.20,
-            score_range=(0, 10),
-            quality_criteria={"creativity": 0.40, "completeness": 0.35, "logic": 0.25},
-            minimax_id="D2-004",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        # ========== D3. 多模态理解测试 (3个) ==========
-
-        self.add_test_case(TestCase(
-            name="D3_001_chart_understanding",
-            category="advanced_features",
-            priority="secondary",
-            prompt="请描述这张图表显示的数据趋势并分析可能的原因：[图表描述：这是一张折线图，显示了2020-2024年某公司收入变化情况]",
-            parameters={"max_tokens": 500, "temperature": 0.7},
-            expected_tokens_range=(300, 500),
-            evaluation_criteria=["visual_understanding", "data_analysis", "reasoning"],
-            metadata={"type": "multimodal", "difficulty": "medium"},
-            dimension="advanced_features",
-            sub_dimension="多模态理解",
-            dimension_weight=0.15,
-            test_weight=0.40,
-            score_range=(0, 10),
-            quality_criteria={"accuracy": 0.45, "completeness": 0.35, "logic": 0.20},
-            minimax_id="D3-001",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        self.add_test_case(TestCase(
-            name="D3_002_visual_analysis",
-            category="advanced_features",
-            priority="secondary",
-            prompt="分析这张产品图片的设计风格、目标用户和使用场景：[图片描述：这是一款智能手表的产品图]",
-            parameters={"max_tokens": 500, "temperature": 0.7},
-            expected_tokens_range=(300, 500),
-            evaluation_criteria=["visual_understanding", "design_insight", "market_analysis"],
-            metadata={"type": "multimodal", "difficulty": "medium"},
-            dimension="advanced_features",
-            sub_dimension="多模态理解",
-            dimension_weight=0.15,
-            test_weight=0.35,
-            score_range=(0, 10),
-            quality_criteria={"accuracy": 0.40, "completeness": 0.35, "logic": 0.25},
-            minimax_id="D3-002",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        self.add_test_case(TestCase(
-            name="D3_003_cross_modal_creation",
-            category="advanced_features",
-            priority="secondary",
-            prompt="根据这张风景照片，创作一首相关的诗歌：[照片描述：这是一张夕阳下的海滩照片]",
-            parameters={"max_tokens": 400, "temperature": 0.8},
-            expected_tokens_range=(250, 400),
-            evaluation_criteria=["visual_understanding", "creativity", "emotional_depth"],
-            metadata={"type": "multimodal", "difficulty": "hard"},
-            dimension="advanced_features",
-            sub_dimension="多模态理解",
-            dimension_weight=0.15,
-            test_weight=0.25,
-            score_range=(0, 10),
-            quality_criteria={"creativity": 0.45, "completeness": 0.30, "logic": 0.25},
-            minimax_id="D3-003",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        # ========== D4. 创新思维能力测试 (2个) ==========
-
-        self.add_test_case(TestCase(
-            name="D4_001_conceptual_innovation",
-            category="advanced_features",
-            priority="primary",
-            prompt="如何重新定义'教育'概念以适应AI时代？提出创新观点",
-            parameters={"max_tokens": 700, "temperature": 0.9},
-            expected_tokens_range=(500, 700),
-            evaluation_criteria=["innovation", "feasibility", "depth"],
-            metadata={"type": "innovative_thinking", "difficulty": "hard"},
-            dimension="advanced_features",
-            sub_dimension="创新思维能力",
-            dimension_weight=0.15,
-            test_weight=0.50,
-            score_range=(0, 10),
-            quality_criteria={"creativity": 0.50, "completeness": 0.30, "logic": 0.20},
-            minimax_id="D4-001",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        self.add_test_case(TestCase(
-            name="D4_002_solution_innovation",
-            category="advanced_features",
-            priority="primary",
-            prompt="传统交通方式面临哪些根本性挑战？提出颠覆性解决方案",
-            parameters={"max_tokens": 800, "temperature": 0.9},
-            expected_tokens_range=(600, 800),
-            evaluation_criteria=["innovation", "feasibility", "impact"],
-            metadata={"type": "innovative_thinking", "difficulty": "hard"},
-            dimension="advanced_features",
-            sub_dimension="创新思维能力",
-            dimension_weight=0.15,
-            test_weight=0.50,
-            score_range=(0, 10),
-            quality_criteria={"creativity": 0.50, "completeness": 0.30, "logic": 0.20},
-            minimax_id="D4-002",
-            expected_score_range=(7.5, 9.5)
-        ))
-
-        # 注册到 minimax_registry
-        for test_case in self.get_test_cases():
-            minimax_registry.register_test(test_case)
-
-
-# 注册到全局 registry（保持兼容）
-from ..test_registry import registry
-registry.register_category(AdvancedFeaturesTests())
+def register():
+    """构建本类别并注册到全局 registry（由包 __init__ 的类别加载器在首次查询注册表时调用一次）"""
+    registry.register_category(AdvancedFeaturesTests())
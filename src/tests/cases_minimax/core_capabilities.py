@@ -8,12 +8,14 @@
 """
 
 from ..base_test import BaseTestCategory, TestCase
-from ..minimax_registry import minimax_registry
+from ..test_registry import registry
 
 
 class CoreCapabilitiesTests(BaseTestCategory):
     """核心能力测试（35个用例）"""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("core_capabilities")
         self._create_tests()
@@ -694,11 +696,7 @@ class CoreCapabilitiesTests(BaseTestCategory):
             expected_score_range=(7.0, 9.0)
         ))
 
-        # 注册到 minimax_registry
-        for test_case in self.get_test_cases():
-            minimax_registry.register_test(test_case)
 
-
-# 注册到全局 registry（保持兼容）
-from ..test_registry import registry
-registry.register_category(CoreCapabilitiesTests())
+def register():
+    """构建本类别并注册到全局 registry（由包 __init__ 的类别加载器在首次查询注册表时调用一次）"""
+    registry.register_category(CoreCapabilitiesTests())
@@ -1,16 +1,41 @@
 """MiniMax 标准测试用例注册表"""
 
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 from collections import Counter
 from .base_test import TestCase
 from .base_registry import BaseTestRegistry
+from .test_registry import registry
 
 
 class MiniMaxTestRegistry(BaseTestRegistry):
-    """MiniMax 标准测试注册表"""
+    """MiniMax 标准测试注册表（全局 registry 的 MiniMax 视图外观，不再单独保存类别用例）"""
+
+    __slots__ = ('_by_id',)
 
     def __init__(self):
         super().__init__()
+        # 直接注册到本表的用例按 minimax_id 建立的索引
+        self._by_id: Dict[str, TestCase] = {}
+
+    @property
+    def _tests(self) -> Dict[str, TestCase]:
+        """用例字典：全局 registry 中带 minimax_id 的用例，再合入直接注册到本表的用例"""
+        view = registry.minimax_view()
+        store = self._store
+        if not store:
+            return view
+        return {**view, **store}
+
+    def _index_ids(self, test_cases: Iterable[TestCase]):
+        """
+        内部方法：将用例按 minimax_id 一次性合入索引
+
+        Args:
+            test_cases: 测试用例序列
+        """
+        self._by_id.update(
+            {tc.minimax_id: tc for tc in test_cases if tc.minimax_id is not None}
+        )
 
     def register(self, test_case: TestCase):
         """
@@ -29,6 +54,18 @@ class MiniMaxTestRegistry(BaseTestRegistry):
             test_case: 测试用例对象
         """
         self._register_test(test_case)
+        self._index_ids((test_case,))
+
+    def register_tests(self, test_cases: Iterable[TestCase]):
+        """
+        批量注册测试用例（名称字典与 minimax_id 索引各一次 update 合入）
+
+        Args:
+            test_cases: 测试用例序列
+        """
+        test_cases = tuple(test_cases)
+        self._register_bulk(test_cases)
+        self._index_ids(test_cases)
 
     def get_all_test_cases(self) -> List[TestCase]:
         """
@@ -61,10 +98,10 @@ class MiniMaxTestRegistry(BaseTestRegistry):
         Returns:
             Optional[TestCase]: 测试用例对象，如果未找到则返回 None
         """
-        return next(
-            (tc for tc in self._tests.values() if tc.minimax_id == minimax_id),
-            None
-        )
+        test_case = self._by_id.get(minimax_id)
+        if test_case is not None:
+            return test_case
+        return registry.minimax_by_id().get(minimax_id)
 
     def get_dimension_summary(self) -> Dict[str, int]:
         """
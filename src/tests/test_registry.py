@@ -1,6 +1,6 @@
 """测试用例注册表"""
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from .base_test import BaseTestCategory, TestCase
 from .base_registry import BaseTestRegistry
 
@@ -8,10 +8,44 @@ from .base_registry import BaseTestRegistry
 class TestRegistry(BaseTestRegistry):
     """测试用例注册表（标准测试用）"""
 
+    __slots__ = ('_categories', '_category_loaders', '_minimax_cache', '_minimax_id_cache')
+
     def __init__(self):
         """初始化注册表"""
         super().__init__()
-        self.categories: Dict[str, BaseTestCategory] = {}
+        self._categories: Dict[str, BaseTestCategory] = {}
+        # 类别加载器：首次查询注册表（类别或用例）时按登记顺序调用一次
+        self._category_loaders: List[Callable[[], None]] = []
+        # minimax_view() / minimax_by_id() 的缓存，注册新类别时失效
+        self._minimax_cache: Optional[Dict[str, TestCase]] = None
+        self._minimax_id_cache: Optional[Dict[str, TestCase]] = None
+
+    @property
+    def categories(self) -> Dict[str, BaseTestCategory]:
+        """已注册的测试类别（访问前先运行尚未执行的类别加载器）"""
+        self._run_category_loaders()
+        return self._categories
+
+    def add_category_loader(self, loader: Callable[[], None]):
+        """
+        登记类别加载器：首次查询注册表时才调用，用于按需导入并注册测试类别
+
+        Args:
+            loader: 无参可调用对象，内部调用 register_category 注册类别
+        """
+        self._category_loaders.append(loader)
+
+    def _run_category_loaders(self):
+        """内部方法：按登记顺序运行类别加载器（先取出再调用，避免重入）"""
+        if self._category_loaders:
+            loaders, self._category_loaders = self._category_loaders, []
+            for loader in loaders:
+                loader()
+
+    def _drain_providers(self) -> Dict[str, TestCase]:
+        """内部方法：先运行类别加载器，再展开用例提供者"""
+        self._run_category_loaders()
+        return super()._drain_providers()
 
     def register(self, category: BaseTestCategory):
         """
@@ -29,10 +63,11 @@ class TestRegistry(BaseTestRegistry):
         Args:
             category: 测试类别
         """
-        self.categories[category.category_name] = category
-        # 同时注册所有测试用例到基类的字典中
-        for test_case in category.get_test_cases():
-            self._register_test(test_case)
+        self._categories[category.category_name] = category
+        # 用例延迟合入基类的字典：首次查询时才迭代该类别
+        self._register_provider(category.iter_test_cases)
+        self._minimax_cache = None
+        self._minimax_id_cache = None
 
     def get_category(self, category_name: str) -> Optional[BaseTestCategory]:
         """
@@ -55,6 +90,33 @@ class TestRegistry(BaseTestRegistry):
         """
         return list(self._tests.values())
 
+    def minimax_view(self) -> Dict[str, TestCase]:
+        """
+        获取 MiniMax 标准用例视图（带 minimax_id 的用例，按名称索引；结果缓存，调用方不应修改）
+
+        Returns:
+            Dict[str, TestCase]: 用例名称到测试用例的映射
+        """
+        if self._minimax_cache is None:
+            self._minimax_cache = {
+                name: tc for name, tc in self._tests.items()
+                if tc.minimax_id is not None
+            }
+        return self._minimax_cache
+
+    def minimax_by_id(self) -> Dict[str, TestCase]:
+        """
+        获取按 minimax_id 索引的 MiniMax 标准用例（结果缓存，调用方不应修改）
+
+        Returns:
+            Dict[str, TestCase]: MiniMax 用例 ID 到测试用例的映射
+        """
+        if self._minimax_id_cache is None:
+            self._minimax_id_cache = {
+                tc.minimax_id: tc for tc in self.minimax_view().values()
+            }
+        return self._minimax_id_cache
+
     def get_test_cases_by_category(self, category_name: str) -> List[TestCase]:
         """
         按类别获取测试用例